@@ -4,11 +4,11 @@ Customer Analytics - Self-contained Streamlit app with local utilities
 import streamlit as st
 import pandas as pd
 import numpy as np
-from snowflake.snowpark.context import get_active_session
+import pyarrow as pa
 
 # Simple local imports - no path manipulation needed
-from common.snowflake_utils import get_active_session_connection
-from common.ui_components import display_metric, create_line_chart, create_pie_chart, display_dataframe, create_scatter_plot, create_bar_chart
+from common.snowflake_utils import resolve_connection
+from common.ui_components import create_line_chart, create_pie_chart, display_dataframe, create_scatter_plot, create_bar_chart
 from common.data_utils import generate_customer_data
 
 st.set_page_config(
@@ -18,13 +18,171 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Constant inputs shared across reruns
+_METRICS = (
+    ("Total Customers", "12,540", "8%"),
+    ("New Customers", "189", "15%"),
+    ("Retention Rate", "92.3%", "2.1%"),
+    ("Avg LTV", "$1,251", "5%"),
+)
+_SEGMENTS = ('Premium', 'Standard', 'Basic', 'New')
+_STR = 'string[pyarrow]'  # Arrow-backed strings for the small lookup frames
+# Month-ends of 2024 (what freq='M' produced), built without DateOffset arithmetic
+_MONTHS_2024 = (np.arange('2024-02', '2025-02', dtype='datetime64[M]') - np.timedelta64(1, 'D')).astype('datetime64[ns]')
+
+@st.cache_data(show_spinner=False)
+def _segment_df() -> pd.DataFrame:
+    """Customer counts per segment."""
+    return pd.DataFrame({
+        'segment': pd.array(_SEGMENTS, dtype=_STR),
+        'customers': pd.array([1250, 4560, 5890, 840], dtype='int32')
+    })
+
+@st.cache_data(show_spinner=False)
+def _revenue_df() -> pd.DataFrame:
+    """Average revenue per segment."""
+    return pd.DataFrame({
+        'segment': pd.array(_SEGMENTS, dtype=_STR),
+        'avg_revenue': pd.array([850, 420, 180, 125], dtype='int32')
+    })
+
+@st.cache_data(show_spinner=False)
+def _tenure_df() -> pd.DataFrame:
+    """Average lifetime value per tenure bucket."""
+    return pd.DataFrame({
+        'tenure_months': pd.array(['0-6', '6-12', '12-24', '24+'], dtype=_STR),
+        'avg_ltv': pd.array([245, 580, 1250, 2100], dtype='int32')
+    })
+
+@st.cache_data(show_spinner=False)
+def _cohort_df() -> pd.DataFrame:
+    """12-month retention cohort."""
+    return pd.DataFrame({
+        'month': _MONTHS_2024,
+        'retention_rate': pd.array([100, 85, 78, 72, 68, 65, 62, 60, 58, 56, 55, 54], dtype='int32')
+    })
+
+@st.cache_data(show_spinner=False)
+def _churn_df() -> pd.DataFrame:
+    """Customers and churn probability per risk level."""
+    return pd.DataFrame({
+        'risk_level': pd.array(['Low', 'Medium', 'High', 'Critical'], dtype=_STR),
+        'customers': pd.array([8500, 2800, 950, 290], dtype='int32'),
+        'churn_probability': pd.array([5, 25, 65, 85], dtype='int32')
+    })
+
+@st.cache_resource(show_spinner=False)
+def _churn_table() -> pa.Table:
+    """Churn table converted to Arrow once, so st.dataframe skips the pandas conversion."""
+    return pa.Table.from_pandas(_churn_df(), preserve_index=False)
+
+@st.cache_data(show_spinner=False)
+def _acquisition_df() -> pd.DataFrame:
+    """Customers and cost per acquisition channel."""
+    return pd.DataFrame({
+        'channel': pd.array(['Organic Search', 'Paid Ads', 'Social Media', 'Email', 'Referral'], dtype=_STR),
+        'customers': pd.array([3200, 2800, 1500, 1200, 800], dtype='int32'),
+        'cost_per_acquisition': pd.array([45, 120, 85, 25, 15], dtype='int32')
+    })
+
+@st.cache_data(show_spinner=False)
+def _trend_df(seed: int = 0) -> pd.DataFrame:
+    """Monthly new customer acquisition (seeded so reruns stay stable)."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'month': _MONTHS_2024,
+        'new_customers': rng.integers(150, 250, 12, dtype=np.int32)
+    })
+
+@st.cache_resource(show_spinner=False)
 def get_snowflake_connection():
-    """Get Snowflake connection - works in SIS"""
-    try:
-        return get_active_session_connection()
-    except:
-        # Fallback for local development would go here
-        return get_active_session()
+    """Get Snowflake connection - SIS session first, then the local Snow CLI connection (resolved once per process)"""
+    return resolve_connection("streamlit_env")
+
+def _segmentation_view():
+    """Customer distribution and revenue by segment"""
+    st.subheader("Customer Segmentation Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        segment_data = _segment_df()
+        create_pie_chart(segment_data, "segment", "customers", "Customer Distribution")
+    
+    with col2:
+        revenue_data = _revenue_df()
+        create_bar_chart(revenue_data, "segment", "avg_revenue", "Average Revenue by Segment")
+
+def _lifetime_value_view():
+    """Customer value distribution and LTV by tenure"""
+    st.subheader("Customer Lifetime Value Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        ltv_data = generate_customer_data(500)
+        create_scatter_plot(ltv_data, "total_orders", "total_spent", "Customer Value Distribution")
+    
+    with col2:
+        tenure_data = _tenure_df()
+        create_bar_chart(tenure_data, "tenure_months", "avg_ltv", "LTV by Customer Tenure")
+
+def _retention_view():
+    """Retention cohort and churn risk"""
+    st.subheader("Customer Retention Analysis")
+    
+    # Retention cohort
+    cohort_data = _cohort_df()
+    create_line_chart(cohort_data, "month", "retention_rate", "12-Month Retention Cohort")
+    
+    # Churn risk analysis
+    st.subheader("Churn Risk Analysis")
+    
+    churn_data = _churn_df()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        create_bar_chart(churn_data, "risk_level", "customers", "Customers by Churn Risk")
+    
+    with col2:
+        display_dataframe(_churn_table(), height=200, use_container_width=True)
+
+def _acquisition_view():
+    """Acquisition channels, cost and monthly trend"""
+    st.subheader("Customer Acquisition Analysis")
+    
+    # Acquisition channels
+    acquisition_data = _acquisition_df()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        create_pie_chart(acquisition_data, "channel", "customers", "Customer Acquisition by Channel")
+    
+    with col2:
+        create_bar_chart(acquisition_data, "channel", "cost_per_acquisition", "Cost per Acquisition")
+    
+    # Monthly acquisition trend
+    st.subheader("Acquisition Trend")
+    
+    trend_data = _trend_df()
+    create_line_chart(trend_data, "month", "new_customers", "Monthly New Customer Acquisition")
+
+# Only the selected view runs; st.tabs would execute all four bodies every rerun
+_VIEWS = {
+    "Segmentation": _segmentation_view,
+    "Lifetime Value": _lifetime_value_view,
+    "Retention": _retention_view,
+    "Acquisition": _acquisition_view,
+}
+
+@st.fragment
+def _analytics_body():
+    """Customer analysis views - reruns independently of the rest of the page"""
+    # Switching views reruns only the fragment, leaving the sidebar and metric row untouched
+    view = st.radio("View", tuple(_VIEWS), horizontal=True, label_visibility="collapsed")
+    _VIEWS[view]()
 
 def main():
     """Customer Analytics Application"""
@@ -39,138 +197,35 @@ def main():
         if st.button("Test Connection"):
             try:
                 conn = get_snowflake_connection()
-                if hasattr(conn, 'test_connection') and conn.test_connection():
+                if conn.test_connection():
+                    # Context captured when the cached connection was created
                     st.success("✅ Connected to Snowflake!")
-                    st.write(f"**Database:** {conn.current_database}")
-                    st.write(f"**Schema:** {conn.current_schema}")
-                    st.write(f"**Warehouse:** {conn.current_warehouse}")
+                    st.write(f"**Database:** {conn.database}")
+                    st.write(f"**Schema:** {conn.schema}")
+                    st.write(f"**Warehouse:** {conn.warehouse}")
                 else:
-                    # Direct session test
-                    session = get_active_session()
-                    st.success("✅ Connected to Snowflake!")
-                    st.write(f"**Database:** {session.get_current_database()}")
-                    st.write(f"**Schema:** {session.get_current_schema()}")
-                    st.write(f"**Warehouse:** {session.get_current_warehouse()}")
+                    st.error("❌ Connection test failed")
             except Exception as e:
                 st.error(f"❌ Connection error: {e}")
         
-        # Filters
+        # Filters (default period computed once per session)
+        if 'date_default' not in st.session_state:
+            now = pd.Timestamp.now()
+            st.session_state.date_default = (now - pd.Timedelta(days=90), now)
         date_range = st.date_input(
             "Analysis Period",
-            value=(pd.Timestamp.now() - pd.Timedelta(days=90), pd.Timestamp.now())
+            value=st.session_state.date_default
         )
         
-        segments = ["All", "Premium", "Standard", "Basic", "New"]
-        selected_segment = st.selectbox("Customer Segment", segments)
-        
-        if st.button("🔄 Refresh Analysis"):
-            st.rerun()
-    
-    # Key customer metrics using nice utility functions
-    col1, col2, col3, col4 = st.columns(4)
+        selected_segment = st.selectbox("Customer Segment", ("All",) + _SEGMENTS)
     
-    with col1:
-        display_metric("Total Customers", "12,540", "8%")
-    with col2:
-        display_metric("New Customers", "189", "15%")
-    with col3:
-        display_metric("Retention Rate", "92.3%", "2.1%")
-    with col4:
-        display_metric("Avg LTV", "$1,251", "5%")
+    # Key customer metrics
+    for col, metric in zip(st.columns(4), _METRICS):
+        col.metric(*metric)
     
     st.markdown("---")
     
-    # Customer analysis tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["Segmentation", "Lifetime Value", "Retention", "Acquisition"])
-    
-    with tab1:
-        st.subheader("Customer Segmentation Analysis")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            segment_data = pd.DataFrame({
-                'segment': ['Premium', 'Standard', 'Basic', 'New'],
-                'customers': [1250, 4560, 5890, 840]
-            })
-            create_pie_chart(segment_data, "segment", "customers", "Customer Distribution")
-        
-        with col2:
-            revenue_data = pd.DataFrame({
-                'segment': ['Premium', 'Standard', 'Basic', 'New'],
-                'avg_revenue': [850, 420, 180, 125]
-            })
-            create_bar_chart(revenue_data, "segment", "avg_revenue", "Average Revenue by Segment")
-    
-    with tab2:
-        st.subheader("Customer Lifetime Value Analysis")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            ltv_data = generate_customer_data(500)
-            create_scatter_plot(ltv_data, "total_orders", "total_spent", "Customer Value Distribution")
-        
-        with col2:
-            tenure_data = pd.DataFrame({
-                'tenure_months': ['0-6', '6-12', '12-24', '24+'],
-                'avg_ltv': [245, 580, 1250, 2100]
-            })
-            create_bar_chart(tenure_data, "tenure_months", "avg_ltv", "LTV by Customer Tenure")
-    
-    with tab3:
-        st.subheader("Customer Retention Analysis")
-        
-        # Retention cohort
-        cohort_data = pd.DataFrame({
-            'month': pd.date_range('2024-01-01', periods=12, freq='M'),
-            'retention_rate': [100, 85, 78, 72, 68, 65, 62, 60, 58, 56, 55, 54]
-        })
-        create_line_chart(cohort_data, "month", "retention_rate", "12-Month Retention Cohort")
-        
-        # Churn risk analysis
-        st.subheader("Churn Risk Analysis")
-        
-        churn_data = pd.DataFrame({
-            'risk_level': ['Low', 'Medium', 'High', 'Critical'],
-            'customers': [8500, 2800, 950, 290],
-            'churn_probability': [5, 25, 65, 85]
-        })
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            create_bar_chart(churn_data, "risk_level", "customers", "Customers by Churn Risk")
-        
-        with col2:
-            display_dataframe(churn_data, height=200, use_container_width=True)
-    
-    with tab4:
-        st.subheader("Customer Acquisition Analysis")
-        
-        # Acquisition channels
-        acquisition_data = pd.DataFrame({
-            'channel': ['Organic Search', 'Paid Ads', 'Social Media', 'Email', 'Referral'],
-            'customers': [3200, 2800, 1500, 1200, 800],
-            'cost_per_acquisition': [45, 120, 85, 25, 15]
-        })
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            create_pie_chart(acquisition_data, "channel", "customers", "Customer Acquisition by Channel")
-        
-        with col2:
-            create_bar_chart(acquisition_data, "channel", "cost_per_acquisition", "Cost per Acquisition")
-        
-        # Monthly acquisition trend
-        st.subheader("Acquisition Trend")
-        
-        trend_data = pd.DataFrame({
-            'month': pd.date_range('2024-01-01', periods=12, freq='M'),
-            'new_customers': np.random.randint(150, 250, 12)
-        })
-        create_line_chart(trend_data, "month", "new_customers", "Monthly New Customer Acquisition")
+    _analytics_body()
 
 if __name__ == "__main__":
     main()
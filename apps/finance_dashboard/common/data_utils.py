@@ -13,8 +13,26 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared PCG64 generator for the demo data below; faster than the legacy
+# np.random functions, which go through the global RandomState
+_RNG = np.random.default_rng(42)
 
-@st.cache_data(ttl=600)  # Cache for 10 minutes
+# Fixed dates behind load_sample_data's demo frame
+_SAMPLE_DATES = pd.date_range('2024-01-01', periods=30, freq='D')
+
+
+@st.cache_resource(ttl="5m", max_entries=16)
+def _date_range(end: pd.Timestamp, periods: int, freq: str = 'D') -> pd.DatetimeIndex:
+    """Shared date index for the generators; DatetimeIndex is immutable, so one copy serves every caller."""
+    return pd.date_range(end=end, periods=periods, freq=freq)
+
+
+def _bucket(as_of: Optional[pd.Timestamp]) -> pd.Timestamp:
+    """as_of, or now floored to the 5-minute cache bucket."""
+    return pd.Timestamp.now().floor('5min') if as_of is None else as_of
+
+
+@st.cache_data(ttl=600, max_entries=8)  # Cache for 10 minutes
 def load_sample_data(query: str, params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
     Load sample data - this would normally execute a query against Snowflake.
@@ -32,13 +50,41 @@ def load_sample_data(query: str, params: Optional[Dict[str, Any]] = None) -> pd.
     logger.info("Loading sample data (demo mode)")
     
     return pd.DataFrame({
-        'date': pd.date_range('2024-01-01', periods=30, freq='D'),
-        'revenue': np.random.normal(10000, 2000, 30),
-        'orders': np.random.poisson(50, 30),
-        'customers': np.random.poisson(30, 30)
+        'date': _SAMPLE_DATES,
+        'revenue': 10000 + 2000 * _RNG.standard_normal(30, dtype=np.float32),
+        'orders': _RNG.poisson(50, 30).astype(np.int32),
+        'customers': _RNG.poisson(30, 30).astype(np.int32)
     })
 
 
+def _if_dated(operation):
+    """Apply operation only when the frame has a 'date' column."""
+    return lambda df: operation(df) if 'date' in df.columns else df
+
+
+def _with_month(df: pd.DataFrame) -> pd.DataFrame:
+    """Add an int8 1-12 'month' column computed on the datetime64[M] values."""
+    dates = df['date']
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        dates = dates.dt.tz_localize(None)  # keep local wall-clock months
+    elif not pd.api.types.is_datetime64_dtype(dates):
+        dates = pd.to_datetime(dates)
+    
+    months = dates.to_numpy(dtype='datetime64[M]')
+    month = (months.astype(np.int64) % 12 + 1).astype(np.int8)
+    missing = np.isnat(months)
+    return df.assign(month=pd.arrays.IntegerArray(month, missing) if missing.any() else month)
+
+
+# Each operation returns a new DataFrame, so the input is never mutated
+_OPERATIONS = {
+    'remove_nulls': lambda df: df.dropna(),
+    'remove_duplicates': lambda df: df.drop_duplicates(),
+    'sort_by_date': _if_dated(lambda df: df.sort_values('date')),
+    'add_month_column': _if_dated(_with_month),
+}
+
+
 def process_data(df: pd.DataFrame, operations: List[str]) -> pd.DataFrame:
     """
     Process DataFrame with specified operations.
@@ -51,19 +97,13 @@ def process_data(df: pd.DataFrame, operations: List[str]) -> pd.DataFrame:
         pd.DataFrame: Processed DataFrame
     """
     try:
-        processed_df = df.copy()
+        processed_df = df
         
         for operation in operations:
-            if operation == 'remove_nulls':
-                processed_df = processed_df.dropna()
-            elif operation == 'remove_duplicates':
-                processed_df = processed_df.drop_duplicates()
-            elif operation == 'sort_by_date':
-                if 'date' in processed_df.columns:
-                    processed_df = processed_df.sort_values('date')
-            elif operation == 'add_month_column':
-                if 'date' in processed_df.columns:
-                    processed_df['month'] = pd.to_datetime(processed_df['date']).dt.month
+            if operation in _OPERATIONS:
+                processed_df = _OPERATIONS[operation](processed_df)
+            else:
+                logger.warning(f"Unknown data operation: {operation}")
                     
         logger.info(f"Data processed with operations: {operations}")
         return processed_df
@@ -114,17 +154,22 @@ def format_percentage(value: Union[int, float], decimal_places: int = 1) -> str:
         return str(value)
 
 
-def validate_data_frame(df: pd.DataFrame, required_columns: List[str]) -> Dict[str, Any]:
+def validate_data_frame(df: pd.DataFrame, required_columns: List[str],
+                        deep: bool = False) -> Dict[str, Any]:
     """
     Validate DataFrame structure and content.
     
     Args:
         df: DataFrame to validate
         required_columns: List of required column names
+        deep: Include the size of object-column contents in memory_usage
+            (walks every Python object, so off by default)
         
     Returns:
         dict: Validation results
     """
+    null_count = int(df.isna().to_numpy().sum())
+    
     validation_results = {
         'is_valid': True,
         'errors': [],
@@ -132,13 +177,14 @@ def validate_data_frame(df: pd.DataFrame, required_columns: List[str]) -> Dict[s
         'info': {
             'rows': len(df),
             'columns': len(df.columns),
-            'memory_usage': df.memory_usage(deep=True).sum(),
-            'null_count': df.isnull().sum().sum()
+            'memory_usage': int(df.memory_usage(deep=deep).sum()),
+            'null_count': null_count
         }
     }
     
     # Check required columns
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    columns = frozenset(df.columns)
+    missing_columns = [col for col in required_columns if col not in columns]
     if missing_columns:
         validation_results['is_valid'] = False
         validation_results['errors'].append(f"Missing required columns: {missing_columns}")
@@ -148,45 +194,56 @@ def validate_data_frame(df: pd.DataFrame, required_columns: List[str]) -> Dict[s
         validation_results['warnings'].append("DataFrame is empty")
     
     # Check for high null percentage
-    null_percentage = (df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100
+    null_percentage = null_count / max(1, df.size) * 100
     if null_percentage > 20:
         validation_results['warnings'].append(f"High null percentage: {null_percentage:.1f}%")
     
     return validation_results
 
 
-@st.cache_data
-def generate_sample_data(days: int = 30) -> pd.DataFrame:
+@st.cache_data(ttl="5m", max_entries=8)
+def generate_sample_data(days: int = 30, as_of: Optional[pd.Timestamp] = None) -> pd.DataFrame:
     """
     Generate sample time series data for demo purposes.
     
     Args:
         days: Number of days of data to generate
+        as_of: Last date of the series (default: now, floored to 5 minutes). Pass a bucketed
+            timestamp such as pd.Timestamp.now().floor('5min') so reruns
+            within the bucket hit the cache.
         
     Returns:
         pd.DataFrame: Sample time series data
     """
-    dates = pd.date_range(end=pd.Timestamp.now(), periods=days, freq='D')
+    dates = _date_range(_bucket(as_of), days)
     
     # Generate correlated sample data
     base_revenue = 8000
     trend = np.linspace(0, 2000, days)  # Upward trend
     seasonality = 1000 * np.sin(2 * np.pi * np.arange(days) / 7)  # Weekly pattern
-    noise = np.random.normal(0, 500, days)
+    noise = 500 * _RNG.standard_normal(days, dtype=np.float32)
     
     revenue = base_revenue + trend + seasonality + noise
     revenue = np.maximum(revenue, 1000)  # Ensure positive values
     
     return pd.DataFrame({
         'date': dates,
-        'revenue': revenue.round(2),
-        'orders': np.random.poisson(revenue / 150),  # Orders correlated with revenue
-        'customers': np.random.poisson(revenue / 200),  # Customers correlated with revenue
-        'avg_order_value': (revenue / np.maximum(1, revenue / 150)).round(2)
+        'revenue': revenue.round(2).astype(np.float32),
+        'orders': _RNG.poisson(revenue / 150).astype(np.int32),  # Orders correlated with revenue
+        'customers': _RNG.poisson(revenue / 200).astype(np.int32),  # Customers correlated with revenue
+        'avg_order_value': (revenue / np.maximum(1, revenue / 150)).round(2).astype(np.float32)
     })
 
 
-@st.cache_data
+# Segment -> (share of customers, mean orders, mean order value, order value std)
+_SEGMENT_PROFILES = {
+    'Premium': (0.1, 15, 300, 50),
+    'Standard': (0.4, 8, 150, 30),
+    'Basic': (0.5, 4, 75, 20),
+}
+
+
+@st.cache_data(ttl=3600, max_entries=4)
 def generate_customer_data(customers: int = 100) -> pd.DataFrame:
     """
     Generate sample customer data for analytics.
@@ -197,74 +254,91 @@ def generate_customer_data(customers: int = 100) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Sample customer data
     """
-    np.random.seed(42)  # For reproducible results
+    rng = np.random.default_rng(42)  # For reproducible results, without touching global state
     
-    # Generate customer segments
-    segments = np.random.choice(['Premium', 'Standard', 'Basic'], customers, p=[0.1, 0.4, 0.5])
+    # Generate customer segments as codes into _SEGMENT_PROFILES
+    names = list(_SEGMENT_PROFILES)
+    shares, order_rates, order_means, order_stds = np.array(list(_SEGMENT_PROFILES.values())).T
+    codes = rng.choice(len(names), customers, p=shares)
     
-    # Generate data based on segments
-    data = []
-    for i in range(customers):
-        segment = segments[i]
-        
-        if segment == 'Premium':
-            orders = np.random.poisson(15)
-            avg_order = np.random.normal(300, 50)
-        elif segment == 'Standard':
-            orders = np.random.poisson(8)
-            avg_order = np.random.normal(150, 30)
-        else:  # Basic
-            orders = np.random.poisson(4)
-            avg_order = np.random.normal(75, 20)
-        
-        total_spent = orders * max(avg_order, 10)  # Ensure positive values
-        
-        data.append({
-            'customer_id': f'CUST_{i+1:04d}',
-            'segment': segment,
-            'total_orders': max(orders, 1),
-            'total_spent': round(total_spent, 2),
-            'avg_order_value': round(total_spent / max(orders, 1), 2),
-            'tenure_months': np.random.randint(1, 36),
-            'last_order_days': np.random.randint(1, 90)
-        })
+    # One batched draw each, with per-customer parameters looked up by segment
+    orders = rng.poisson(order_rates[codes])
+    avg_order = order_means[codes] + order_stds[codes] * rng.standard_normal(customers, dtype=np.float32)
+    
+    total_spent = orders * np.maximum(avg_order, 10)  # Ensure positive values
+    total_orders = np.maximum(orders, 1)
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'customer_id': pd.array(
+            np.char.add('CUST_', np.char.zfill(np.arange(1, customers + 1).astype(str), 4)),
+            dtype='string[pyarrow]'
+        ),
+        'segment': pd.Categorical.from_codes(codes, categories=names),
+        'total_orders': total_orders.astype(np.int32),
+        'total_spent': total_spent.round(2).astype(np.float32),
+        'avg_order_value': (total_spent / total_orders).round(2).astype(np.float32),
+        'tenure_months': rng.integers(1, 36, customers, dtype=np.int16),
+        'last_order_days': rng.integers(1, 90, customers, dtype=np.int16)
+    })
 
 
-@st.cache_data
-def generate_trend_data(days: int = 90) -> pd.DataFrame:
+def _moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing moving average from one cumulative sum.
+    
+    Matches ``rolling(window, min_periods=1).mean()``: the first points
+    average over however many values are available so far.
+    
+    Args:
+        values: 1-D array of values
+        window: Number of trailing points to average
+        
+    Returns:
+        np.ndarray: Moving average, same length as values
+    """
+    sums = np.cumsum(values, dtype=np.float64)
+    sums[window:] = sums[window:] - sums[:-window]
+    return sums / np.minimum(np.arange(1, len(values) + 1), window)
+
+
+@st.cache_data(ttl="5m", max_entries=8)
+def generate_trend_data(days: int = 90, as_of: Optional[pd.Timestamp] = None) -> pd.DataFrame:
     """
     Generate sample trend data for forecasting demos.
     
     Args:
         days: Number of days of data to generate
+        as_of: Last date of the series (default: now, floored to 5 minutes); see generate_sample_data
         
     Returns:
         pd.DataFrame: Sample trend data
     """
-    dates = pd.date_range(end=pd.Timestamp.now(), periods=days, freq='D')
+    dates = _date_range(_bucket(as_of), days)
     
-    # Generate trend with growth
+    # Generate trend with growth, building everything in place in two buffers
     base_value = 1000
     growth_rate = 0.02  # 2% growth over the period
-    trend = base_value * (1 + growth_rate * np.arange(days) / days)
+    steps = np.arange(days, dtype=np.float64)
+    daily_sales = steps * (base_value * growth_rate / days)
+    daily_sales += base_value
     
     # Add seasonality and noise
-    seasonality = 200 * np.sin(2 * np.pi * np.arange(days) / 30)  # Monthly pattern
-    noise = np.random.normal(0, 50, days)
+    steps *= 2 * np.pi / 30
+    np.sin(steps, out=steps)
+    steps *= 200  # Monthly pattern
+    daily_sales += steps
+    daily_sales += 50 * _RNG.standard_normal(days, dtype=np.float32)
     
-    daily_sales = trend + seasonality + noise
-    daily_sales = np.maximum(daily_sales, 100)  # Ensure positive values
+    np.maximum(daily_sales, 100, out=daily_sales)  # Ensure positive values
     
     cumulative_sales = np.cumsum(daily_sales)
     
     return pd.DataFrame({
         'date': dates,
-        'daily_sales': daily_sales.round(2),
-        'cumulative_sales': cumulative_sales.round(2),
-        'moving_avg_7d': pd.Series(daily_sales).rolling(window=7, min_periods=1).mean().round(2),
-        'moving_avg_30d': pd.Series(daily_sales).rolling(window=30, min_periods=1).mean().round(2)
+        'daily_sales': daily_sales.round(2).astype(np.float32),
+        'cumulative_sales': cumulative_sales.round(2).astype(np.float32),
+        'moving_avg_7d': _moving_average(daily_sales, 7).round(2).astype(np.float32),
+        'moving_avg_30d': _moving_average(daily_sales, 30).round(2).astype(np.float32)
     })
 
 
@@ -287,6 +361,24 @@ def calculate_growth_rate(current_value: float, previous_value: float) -> float:
         return 0.0
 
 
+def calculate_growth_rate_array(current_values: np.ndarray, previous_values: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_growth_rate for whole columns at once.
+    
+    Args:
+        current_values: Current period values
+        previous_values: Previous period values
+        
+    Returns:
+        np.ndarray: Growth rates as decimals, 0.0 wherever the previous value is 0
+    """
+    current_values = np.asarray(current_values, dtype=np.float64)
+    previous_values = np.asarray(previous_values, dtype=np.float64)
+    growth = np.zeros(np.broadcast(current_values, previous_values).shape)
+    np.divide(current_values - previous_values, previous_values, out=growth, where=previous_values != 0)
+    return growth
+
+
 def create_pivot_table(df: pd.DataFrame, 
                       index_col: str, 
                       value_col: str, 
@@ -301,19 +393,27 @@ def create_pivot_table(df: pd.DataFrame,
         agg_func: Aggregation function ('sum', 'mean', 'count', etc.)
         
     Returns:
-        pd.DataFrame: Pivot table
+        pd.DataFrame: Pivot table, one row per index value in order of first appearance.
+        A missing column raises KeyError rather than returning an empty frame.
     """
-    try:
-        pivot = df.pivot_table(
-            index=index_col,
-            values=value_col,
-            aggfunc=agg_func,
-            fill_value=0
-        )
-        return pivot.reset_index()
-    except Exception as e:
-        logger.error(f"Pivot table creation failed: {e}")
-        return pd.DataFrame()
+    return (
+        df.groupby(index_col, sort=False, observed=True, as_index=False)[value_col]
+        .agg(agg_func)
+        .fillna({value_col: 0})
+    )
+
+
+def _date_order(df: pd.DataFrame, date_col: str) -> tuple:
+    """Parse date_col and return its non-null dates in sorted order with their row positions."""
+    dates = pd.to_datetime(df[date_col]).reset_index(drop=True).dropna().sort_values(kind='stable')
+    return pd.DatetimeIndex(dates), dates.index.to_numpy()
+
+
+def _as_tz(timestamp: pd.Timestamp, tz) -> pd.Timestamp:
+    """Express a bound in the timezone of the dates it is compared against."""
+    if tz is None:
+        return timestamp
+    return timestamp.tz_localize(tz) if timestamp.tzinfo is None else timestamp.tz_convert(tz)
 
 
 def filter_data_by_date_range(df: pd.DataFrame, 
@@ -330,14 +430,17 @@ def filter_data_by_date_range(df: pd.DataFrame,
         end_date: End date (string format)
         
     Returns:
-        pd.DataFrame: Filtered DataFrame
+        pd.DataFrame: Filtered DataFrame, in the original row order and index,
+        with date_col parsed to datetimes
     """
     try:
-        df_copy = df.copy()
-        df_copy[date_col] = pd.to_datetime(df_copy[date_col])
+        dates, positions = _date_order(df, date_col)
+        lo = dates.searchsorted(_as_tz(pd.Timestamp(start_date), dates.tz), side='left')
+        hi = dates.searchsorted(_as_tz(pd.Timestamp(end_date), dates.tz), side='right')
         
-        mask = (df_copy[date_col] >= start_date) & (df_copy[date_col] <= end_date)
-        return df_copy[mask]
+        # Take the matching rows back in their original order
+        window = pd.Series(dates[lo:hi], index=positions[lo:hi]).sort_index()
+        return df.iloc[window.index].assign(**{date_col: window.array})
         
     except Exception as e:
         logger.error(f"Date filtering failed: {e}")
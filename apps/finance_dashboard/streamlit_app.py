@@ -4,11 +4,10 @@ Finance Dashboard - Self-contained Streamlit app with local utilities
 import streamlit as st
 import pandas as pd
 import numpy as np
-from snowflake.snowpark.context import get_active_session
 
 # Simple local imports - no path manipulation needed
-from common.snowflake_utils import get_active_session_connection
-from common.ui_components import display_metric, create_line_chart, create_bar_chart, create_pie_chart, display_dataframe
+from common.snowflake_utils import resolve_connection
+from common.ui_components import create_line_chart, create_bar_chart, create_pie_chart, display_dataframe
 from common.data_utils import generate_sample_data
 
 st.set_page_config(
@@ -18,13 +17,157 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Constant inputs shared across reruns
+_METRICS = (
+    ("Total Revenue", "$3.2M", "15%"),
+    ("Net Profit", "$485K", "22%"),
+    ("Operating Margin", "15.2%", "1.8%"),
+    ("Cash Flow", "$720K", "8%"),
+)
+# Month-ends from January 2024 (what freq='M' produced), built without DateOffset arithmetic
+_MONTHS_18 = (np.arange('2024-02', '2025-08', dtype='datetime64[M]') - np.timedelta64(1, 'D')).astype('datetime64[ns]')
+_MONTHS_2024 = _MONTHS_18[:12]
+
+@st.cache_data(show_spinner=False, ttl="5m", max_entries=8)
+def _revenue_df(as_of: pd.Timestamp) -> pd.DataFrame:
+    """Monthly revenue sample scaled up for finance."""
+    revenue_data = generate_sample_data(12, as_of)
+    revenue_data['revenue'] = revenue_data['revenue'] * 10  # Scale up for finance
+    return revenue_data
+
+@st.cache_data(show_spinner=False)
+def _budget_df() -> pd.DataFrame:
+    """Budget allocation per department."""
+    return pd.DataFrame({
+        'department': ['Sales', 'Marketing', 'Operations', 'R&D', 'Finance'],
+        'budget': [850000, 420000, 680000, 320000, 180000]
+    })
+
+@st.cache_data(show_spinner=False)
+def _pnl_df() -> pd.DataFrame:
+    """P&L breakdown by category."""
+    return pd.DataFrame({
+        'category': ['Revenue', 'COGS', 'Operating Expenses', 'Net Income'],
+        'amount': [3200000, -1800000, -915000, 485000]
+    })
+
+@st.cache_data(show_spinner=False)
+def _monthly_pnl_df(seed: int = 0) -> pd.DataFrame:
+    """Monthly revenue, expenses and net income (seeded so reruns stay stable)."""
+    rng = np.random.default_rng(seed)
+    monthly_pnl = pd.DataFrame({
+        'month': _MONTHS_2024,
+        'revenue': rng.normal(320000, 50000, 12),
+        'expenses': rng.normal(-220000, 30000, 12)
+    })
+    monthly_pnl['net_income'] = monthly_pnl['revenue'] + monthly_pnl['expenses']
+    return monthly_pnl
+
+@st.cache_data(show_spinner=False)
+def _cashflow_df(seed: int = 0) -> pd.DataFrame:
+    """Monthly operating, investing and financing cash flow (seeded so reruns stay stable)."""
+    rng = np.random.default_rng(seed)
+    cashflow_data = pd.DataFrame({
+        'month': _MONTHS_2024,
+        'operating_cf': rng.normal(60000, 15000, 12),
+        'investing_cf': rng.normal(-20000, 10000, 12),
+        'financing_cf': rng.normal(-10000, 5000, 12)
+    })
+    cashflow_data['net_cf'] = (cashflow_data['operating_cf'] + 
+                               cashflow_data['investing_cf'] + 
+                               cashflow_data['financing_cf'])
+    return cashflow_data
+
+@st.cache_data(show_spinner=False)
+def _budget_vs_actual_df() -> pd.DataFrame:
+    """Budgeted vs actual spend per department."""
+    return pd.DataFrame({
+        'department': ['Sales', 'Marketing', 'Operations', 'R&D', 'Finance'],
+        'budget': [850000, 420000, 680000, 320000, 180000],
+        'actual': [892000, 398000, 715000, 287000, 165000],
+        'variance': [42000, -22000, 35000, -33000, -15000]
+    })
+
+@st.cache_data(show_spinner=False)
+def _forecast_df(seed: int = 0) -> pd.DataFrame:
+    """12 months of actuals followed by a 6-month forecast (seeded so reruns stay stable)."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'month': _MONTHS_18,
+        'actual': list(rng.normal(320000, 50000, 12)) + [None] * 6,
+        'forecast': [None] * 12 + list(rng.normal(380000, 60000, 6))
+    })
+
+@st.cache_resource(show_spinner=False)
 def get_snowflake_connection():
-    """Get Snowflake connection - works in SIS"""
-    try:
-        return get_active_session_connection()
-    except:
-        # Fallback for local development would go here
-        return get_active_session()
+    """Get Snowflake connection - SIS session first, then the local Snow CLI connection (resolved once per process)"""
+    return resolve_connection("streamlit_env")
+
+@st.fragment
+def _pnl_tab():
+    """P&L breakdown and monthly net income"""
+    st.subheader("Profit & Loss Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        pnl_data = _pnl_df()
+        create_bar_chart(pnl_data, "category", "amount", "P&L Breakdown")
+    
+    with col2:
+        # Monthly P&L trend
+        monthly_pnl = _monthly_pnl_df()
+        create_line_chart(monthly_pnl, "month", "net_income", "Monthly Net Income")
+
+@st.fragment
+def _cashflow_tab():
+    """Net cash flow trend and summary table"""
+    st.subheader("Cash Flow Analysis")
+    
+    # Cash flow data
+    cashflow_data = _cashflow_df()
+    
+    create_line_chart(cashflow_data, "month", "net_cf", "Net Cash Flow Trend")
+    
+    # Cash flow summary
+    st.subheader("Cash Flow Summary")
+    display_dataframe(cashflow_data, height=300, use_container_width=True)
+
+@st.fragment
+def _budget_tab():
+    """Budgeted vs actual spend per department"""
+    st.subheader("Budget vs Actual Performance")
+    
+    budget_vs_actual = _budget_vs_actual_df()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        create_bar_chart(budget_vs_actual, "department", "budget", "Budgeted Amounts")
+    
+    with col2:
+        create_bar_chart(budget_vs_actual, "department", "actual", "Actual Spending")
+
+@st.fragment
+def _forecast_tab():
+    """Forecast headline metrics and revenue forecast"""
+    st.subheader("Financial Forecasting")
+    
+    # Forecast metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Q4 Revenue Forecast", "$3.8M", "18.8%")
+    with col2:
+        st.metric("Annual Profit Target", "$2.1M", "25.2%")
+    with col3:
+        st.metric("ROI Projection", "28.5%", "3.2%")
+    
+    # Forecast chart
+    forecast_data = _forecast_df()
+    
+    st.subheader("Revenue Forecast")
+    # Only the actuals are plotted, so skip the None-padded forecast months
+    create_line_chart(forecast_data.dropna(subset=['actual']), "month", "actual", "Actual vs Forecast")
 
 def main():
     """Finance Dashboard Application"""
@@ -40,25 +183,24 @@ def main():
         if st.button("Test Connection"):
             try:
                 conn = get_snowflake_connection()
-                if hasattr(conn, 'test_connection') and conn.test_connection():
+                if conn.test_connection():
+                    # Context captured when the cached connection was created
                     st.success("✅ Connected to Snowflake!")
-                    st.write(f"**Database:** {conn.current_database}")
-                    st.write(f"**Schema:** {conn.current_schema}")
-                    st.write(f"**Warehouse:** {conn.current_warehouse}")
+                    st.write(f"**Database:** {conn.database}")
+                    st.write(f"**Schema:** {conn.schema}")
+                    st.write(f"**Warehouse:** {conn.warehouse}")
                 else:
-                    # Direct session test
-                    session = get_active_session()
-                    st.success("✅ Connected to Snowflake!")
-                    st.write(f"**Database:** {session.get_current_database()}")
-                    st.write(f"**Schema:** {session.get_current_schema()}")
-                    st.write(f"**Warehouse:** {session.get_current_warehouse()}")
+                    st.error("❌ Connection test failed")
             except Exception as e:
                 st.error(f"❌ Connection error: {e}")
         
-        # Filters
+        # Filters (default period computed once per session)
+        if 'date_default' not in st.session_state:
+            now = pd.Timestamp.now()
+            st.session_state.date_default = (now - pd.Timedelta(days=30), now)
         date_range = st.date_input(
             "Reporting Period",
-            value=(pd.Timestamp.now() - pd.Timedelta(days=30), pd.Timestamp.now())
+            value=st.session_state.date_default
         )
         
         departments = ["All", "Sales", "Marketing", "Operations", "R&D", "Finance"]
@@ -68,16 +210,8 @@ def main():
             st.rerun()
     
     # Key financial metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        display_metric("Total Revenue", "$3.2M", "15%")
-    with col2:
-        display_metric("Net Profit", "$485K", "22%")
-    with col3:
-        display_metric("Operating Margin", "15.2%", "1.8%")
-    with col4:
-        display_metric("Cash Flow", "$720K", "8%")
+    for col, metric in zip(st.columns(4), _METRICS):
+        col.metric(*metric)
     
     st.markdown("---")
     
@@ -86,104 +220,31 @@ def main():
     
     with col1:
         st.subheader("📈 Monthly Revenue")
-        revenue_data = generate_sample_data(12)
-        revenue_data['revenue'] = revenue_data['revenue'] * 10  # Scale up for finance
+        revenue_data = _revenue_df(pd.Timestamp.now().floor('5min'))
         create_line_chart(revenue_data, "date", "revenue", "Monthly Revenue Trend")
     
     with col2:
         st.subheader("💼 Department Budgets")
-        budget_data = pd.DataFrame({
-            'department': ['Sales', 'Marketing', 'Operations', 'R&D', 'Finance'],
-            'budget': [850000, 420000, 680000, 320000, 180000]
-        })
+        budget_data = _budget_df()
         create_pie_chart(budget_data, "department", "budget", "Budget Allocation")
     
     st.markdown("---")
     
-    # Financial analysis tabs
+    # Financial analysis tabs - each body is a fragment, so widgets added to a
+    # tab rerun only that tab
     tab1, tab2, tab3, tab4 = st.tabs(["P&L Analysis", "Cash Flow", "Budget vs Actual", "Forecasting"])
     
     with tab1:
-        st.subheader("Profit & Loss Analysis")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            pnl_data = pd.DataFrame({
-                'category': ['Revenue', 'COGS', 'Operating Expenses', 'Net Income'],
-                'amount': [3200000, -1800000, -915000, 485000]
-            })
-            create_bar_chart(pnl_data, "category", "amount", "P&L Breakdown")
-        
-        with col2:
-            # Monthly P&L trend
-            monthly_pnl = pd.DataFrame({
-                'month': pd.date_range('2024-01-01', periods=12, freq='M'),
-                'revenue': np.random.normal(320000, 50000, 12),
-                'expenses': np.random.normal(-220000, 30000, 12)
-            })
-            monthly_pnl['net_income'] = monthly_pnl['revenue'] + monthly_pnl['expenses']
-            create_line_chart(monthly_pnl, "month", "net_income", "Monthly Net Income")
+        _pnl_tab()
     
     with tab2:
-        st.subheader("Cash Flow Analysis")
-        
-        # Cash flow data
-        cashflow_data = pd.DataFrame({
-            'month': pd.date_range('2024-01-01', periods=12, freq='M'),
-            'operating_cf': np.random.normal(60000, 15000, 12),
-            'investing_cf': np.random.normal(-20000, 10000, 12),
-            'financing_cf': np.random.normal(-10000, 5000, 12)
-        })
-        cashflow_data['net_cf'] = (cashflow_data['operating_cf'] + 
-                                   cashflow_data['investing_cf'] + 
-                                   cashflow_data['financing_cf'])
-        
-        create_line_chart(cashflow_data, "month", "net_cf", "Net Cash Flow Trend")
-        
-        # Cash flow summary
-        st.subheader("Cash Flow Summary")
-        display_dataframe(cashflow_data, height=300, use_container_width=True)
+        _cashflow_tab()
     
     with tab3:
-        st.subheader("Budget vs Actual Performance")
-        
-        budget_vs_actual = pd.DataFrame({
-            'department': ['Sales', 'Marketing', 'Operations', 'R&D', 'Finance'],
-            'budget': [850000, 420000, 680000, 320000, 180000],
-            'actual': [892000, 398000, 715000, 287000, 165000],
-            'variance': [42000, -22000, 35000, -33000, -15000]
-        })
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            create_bar_chart(budget_vs_actual, "department", "budget", "Budgeted Amounts")
-        
-        with col2:
-            create_bar_chart(budget_vs_actual, "department", "actual", "Actual Spending")
+        _budget_tab()
     
     with tab4:
-        st.subheader("Financial Forecasting")
-        
-        # Forecast metrics
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Q4 Revenue Forecast", "$3.8M", "18.8%")
-        with col2:
-            st.metric("Annual Profit Target", "$2.1M", "25.2%")
-        with col3:
-            st.metric("ROI Projection", "28.5%", "3.2%")
-        
-        # Forecast chart
-        forecast_data = pd.DataFrame({
-            'month': pd.date_range('2024-01-01', periods=18, freq='M'),
-            'actual': list(np.random.normal(320000, 50000, 12)) + [None] * 6,
-            'forecast': [None] * 12 + list(np.random.normal(380000, 60000, 6))
-        })
-        
-        st.subheader("Revenue Forecast")
-        create_line_chart(forecast_data, "month", "actual", "Actual vs Forecast")
+        _forecast_tab()
 
 if __name__ == "__main__":
     main()
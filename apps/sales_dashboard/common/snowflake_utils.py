@@ -470,6 +470,27 @@ def get_active_session_connection() -> SnowflakeConnection:
     """
     return SnowflakeConnection.from_active_session()
 
+def resolve_connection(connection_name: str = "streamlit_env") -> SnowflakeConnection:
+    """Resolve the connection for the current environment
+    
+    Tries the active session first (Streamlit in Snowflake), then the named
+    Snow CLI connection for local runs. Callers should cache the result
+    (e.g. with st.cache_resource) so the probe runs once per process.
+    
+    Args:
+        connection_name: Snow CLI connection to fall back to
+        
+    Returns:
+        SnowflakeConnection instance (raises ConnectionError if neither is available)
+    """
+    for resolve in (get_active_session_connection, lambda: get_connection(connection_name)):
+        try:
+            return resolve()
+        except (ConnectionError, ConfigurationError, ValueError) as e:
+            # ValueError covers pydantic validation of an incomplete connection config
+            logger.debug(f"Connection probe failed: {e}")
+    raise ConnectionError(f"No active session or {connection_name} connection available")
+
 def get_warehouse_info(connection_name: Optional[str] = None) -> dict:
     """Get information about current warehouse"""
     conn = get_connection(connection_name)
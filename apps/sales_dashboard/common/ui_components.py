@@ -5,15 +5,34 @@ This module provides common UI elements and layouts that can be
 shared across different Streamlit applications.
 """
 
+import functools
+import hashlib
+import io
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
+import pyarrow as pa
 from typing import Optional, List, Dict, Any, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+# st.plotly_chart serializes through plotly.io, so every chart helper below
+# gets orjson's C encoder (with native numpy support) when it is installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    logger.debug("orjson not installed; Plotly figures use the json engine")
+
+
+@functools.lru_cache(maxsize=256)
+def _title(name: str) -> str:
+    """Human-readable label for a snake_case column or metric name."""
+    return name.replace('_', ' ').title()
+
 
 def create_sidebar(title: str = "Navigation", options: Optional[List[Dict[str, Any]]] = None) -> str:
     """
@@ -53,6 +72,14 @@ def display_metric(title: str, value: str, delta: Optional[str] = None) -> None:
     st.metric(title, value, delta)
 
 
+# Named value formats accepted by display_metrics' format_func
+_METRIC_FORMATS = {
+    'currency': "${:,.2f}".format,
+    'percentage': "{:.1%}".format,
+    'number': "{:,.0f}".format,
+}
+
+
 def display_metrics(metrics: Dict[str, Union[float, int]], 
                    columns: int = 4,
                    format_func: Optional[Dict[str, str]] = None) -> None:
@@ -64,38 +91,35 @@ def display_metrics(metrics: Dict[str, Union[float, int]],
         columns: Number of columns to display
         format_func: Optional formatting functions for each metric
     """
+    format_func = format_func or {}
     cols = st.columns(columns)
     
     for i, (key, value) in enumerate(metrics.items()):
-        with cols[i % columns]:
-            # Apply formatting if provided
-            if format_func and key in format_func:
-                if format_func[key] == 'currency':
-                    formatted_value = f"${value:,.2f}"
-                elif format_func[key] == 'percentage':
-                    formatted_value = f"{value:.1%}"
-                elif format_func[key] == 'number':
-                    formatted_value = f"{value:,.0f}"
-                else:
-                    formatted_value = str(value)
-            else:
-                formatted_value = str(value)
-            
-            st.metric(key.replace('_', ' ').title(), formatted_value)
+        # Apply formatting if provided; unknown or missing formats fall back to str
+        formatter = _METRIC_FORMATS.get(format_func.get(key), str)
+        cols[i % columns].metric(_title(key), formatter(value))
 
 
 def display_dataframe(df: pd.DataFrame, 
                      height: Optional[int] = None,
-                     use_container_width: bool = True) -> None:
+                     use_container_width: bool = True,
+                     column_config: Optional[Dict[str, Any]] = None,
+                     hide_index: Optional[bool] = None) -> None:
     """
     Display a DataFrame with optional styling.
     
+    Formatting goes through column_config (applied by the grid itself) rather
+    than a pandas Styler, which would be rendered cell by cell on every rerun.
+    
     Args:
-        df: DataFrame to display
+        df: DataFrame (or Arrow table) to display
         height: Optional height in pixels
         use_container_width: Whether to use container width
+        column_config: Optional st.column_config settings per column
+        hide_index: Whether to hide the index (default: Streamlit decides)
     """
-    st.dataframe(df, height=height, use_container_width=use_container_width)
+    st.dataframe(df, height=height, use_container_width=use_container_width,
+                 column_config=column_config, hide_index=hide_index)
 
 
 def create_data_table(df: pd.DataFrame,
@@ -114,14 +138,157 @@ def create_data_table(df: pd.DataFrame,
     if title:
         st.subheader(title)
     
-    display_df = df.copy()
-    if max_rows and len(display_df) > max_rows:
-        display_df = display_df.head(max_rows)
+    # st.dataframe does not mutate its input, so no defensive copy is needed
+    display_df = df
+    if max_rows and len(df) > max_rows:
+        display_df = df.head(max_rows)
         st.caption(f"Showing first {max_rows} of {len(df)} rows")
     
     st.dataframe(display_df, use_container_width=True, hide_index=not show_index)
 
 
+def _frame_digest(df: pd.DataFrame) -> tuple:
+    """
+    Cache key covering every row of a DataFrame.
+    
+    Streamlit hashes frames of 50k+ rows from a sample, so two versions of a
+    large frame could otherwise share a cached figure.
+    """
+    rows = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return (
+        tuple(map(str, df.columns)),
+        tuple(map(str, df.dtypes)),
+        hashlib.blake2b(rows.tobytes(), digest_size=16).hexdigest(),
+    )
+
+
+# The figure builders below are cached with st.cache_data, so every caller
+# gets its own unpickled Figure and can update_layout/add_trace freely.
+# They declare traces as plain dicts on go.Figure instead of calling plotly
+# express, which validates once but skips px's per-call frame processing.
+_figure_cache = st.cache_data(show_spinner=False, max_entries=64,
+                              hash_funcs={pd.DataFrame: _frame_digest})
+
+
+def _color_groups(df: pd.DataFrame, color_col: Optional[str]) -> List[tuple]:
+    """(legend name, rows) pairs - a single unnamed group when color_col is unset."""
+    if not color_col:
+        return [(None, df)]
+    return [(str(key), group) for key, group in df.groupby(color_col, sort=False, observed=True)]
+
+
+def _xy_traces(df: pd.DataFrame, x_col: str, y_col: str,
+               color_col: Optional[str], **trace: Any) -> List[Dict[str, Any]]:
+    """Trace dicts for an x/y chart, one per color group."""
+    traces = []
+    for name, group in _color_groups(df, color_col):
+        xy = dict(trace, x=group[x_col].to_numpy(), y=group[y_col].to_numpy())
+        if name is not None:
+            xy.update(name=name, legendgroup=name)
+        traces.append(xy)
+    return traces
+
+
+def _xy_layout(x_col: str, y_col: str, title: Optional[str],
+               color_col: Optional[str]) -> Dict[str, Any]:
+    """Shared layout for x/y charts: titled axes, legend only when grouped."""
+    return {
+        "title": {"text": title},
+        "xaxis": {"title": {"text": _title(x_col)}},
+        "yaxis": {"title": {"text": _title(y_col)}},
+        "legend": {"title": {"text": color_col}},
+        "showlegend": bool(color_col),
+    }
+
+
+@_figure_cache
+def _line_figure(df: pd.DataFrame, x_col: str, y_col: str,
+                 title: Optional[str], color_col: Optional[str]) -> go.Figure:
+    """Build (and memoize) the line chart figure."""
+    return go.Figure(
+        data=_xy_traces(df, x_col, y_col, color_col, type="scatter", mode="lines"),
+        layout=_xy_layout(x_col, y_col, title, color_col)
+    )
+
+
+@_figure_cache
+def _bar_figure(df: pd.DataFrame, x_col: str, y_col: str, title: Optional[str],
+                color_col: Optional[str], orientation: str) -> go.Figure:
+    """Build (and memoize) the bar chart figure."""
+    if orientation == 'h':
+        traces = _xy_traces(df, y_col, x_col, color_col, type="bar", orientation="h")
+    else:
+        traces = _xy_traces(df, x_col, y_col, color_col, type="bar")
+    
+    layout = _xy_layout(x_col, y_col, title, color_col)
+    layout["barmode"] = "relative"
+    return go.Figure(data=traces, layout=layout)
+
+
+@_figure_cache
+def _pie_figure(df: pd.DataFrame, names_col: str, values_col: str,
+                title: Optional[str]) -> go.Figure:
+    """Build (and memoize) the pie chart figure."""
+    return go.Figure(
+        data=[{
+            "type": "pie",
+            "labels": df[names_col].to_numpy(),
+            "values": df[values_col].to_numpy(),
+            "textposition": "inside",
+            "textinfo": "percent+label",
+        }],
+        layout={"title": {"text": title}}
+    )
+
+
+@_figure_cache
+def _scatter_figure(df: pd.DataFrame, x_col: str, y_col: str, title: Optional[str],
+                    color_col: Optional[str], size_col: Optional[str]) -> go.Figure:
+    """Build (and memoize) the scatter plot figure."""
+    traces = _xy_traces(df, x_col, y_col, color_col, type="scatter", mode="markers")
+    if size_col:
+        # Same area scaling plotly express uses with its default size_max=20
+        sizeref = df[size_col].max() / 20 ** 2
+        for trace, (_, group) in zip(traces, _color_groups(df, color_col)):
+            trace["marker"] = {"size": group[size_col].to_numpy(),
+                               "sizemode": "area", "sizeref": sizeref}
+    return go.Figure(data=traces, layout=_xy_layout(x_col, y_col, title, color_col))
+
+
+@_figure_cache
+def _area_figure(df: pd.DataFrame, x_col: str, y_col: str,
+                 title: Optional[str], color_col: Optional[str]) -> go.Figure:
+    """Build (and memoize) the area chart figure."""
+    return go.Figure(
+        data=_xy_traces(df, x_col, y_col, color_col,
+                        type="scatter", mode="lines", stackgroup="1"),
+        layout=_xy_layout(x_col, y_col, title, color_col)
+    )
+
+
+def _can_plot(df: pd.DataFrame, chart: str, cols: tuple, *optional_cols: Optional[str]) -> bool:
+    """
+    Check a chart's input before building the figure.
+    
+    Shows an error for missing columns, or a notice when there is nothing to
+    plot (empty frame, or a required column with no values), and returns False.
+    """
+    if df is None or df.empty:
+        st.info("No data to display")
+        return False
+    
+    missing = [col for col in cols + optional_cols if col and col not in df.columns]
+    if missing:
+        logger.error(f"Error creating {chart}: missing columns {missing}")
+        st.error(f"Failed to create {chart}: missing column(s) {', '.join(missing)}")
+        return False
+    
+    if any(df[col].isna().all() for col in cols):
+        st.info("No data to display")
+        return False
+    return True
+
+
 def create_line_chart(df: pd.DataFrame,
                      x_col: str,
                      y_col: str,
@@ -137,15 +304,13 @@ def create_line_chart(df: pd.DataFrame,
         title: Optional chart title
         color_col: Optional column for color grouping
     """
+    if not _can_plot(df, "line chart", (x_col, y_col), color_col):
+        return
+    
     try:
-        fig = px.line(df, x=x_col, y=y_col, color=color_col, title=title)
-        fig.update_layout(
-            xaxis_title=x_col.replace('_', ' ').title(),
-            yaxis_title=y_col.replace('_', ' ').title(),
-            showlegend=bool(color_col)
-        )
+        fig = _line_figure(df, x_col, y_col, title, color_col)
         st.plotly_chart(fig, use_container_width=True)
-    except Exception as e:
+    except (ValueError, KeyError, TypeError) as e:
         logger.error(f"Error creating line chart: {e}")
         st.error(f"Failed to create line chart: {str(e)}")
 
@@ -167,19 +332,13 @@ def create_bar_chart(df: pd.DataFrame,
         color_col: Optional column for color grouping
         orientation: Chart orientation ('v' for vertical, 'h' for horizontal)
     """
+    if not _can_plot(df, "bar chart", (x_col, y_col), color_col):
+        return
+    
     try:
-        if orientation == 'h':
-            fig = px.bar(df, x=y_col, y=x_col, color=color_col, title=title, orientation='h')
-        else:
-            fig = px.bar(df, x=x_col, y=y_col, color=color_col, title=title)
-        
-        fig.update_layout(
-            xaxis_title=x_col.replace('_', ' ').title(),
-            yaxis_title=y_col.replace('_', ' ').title(),
-            showlegend=bool(color_col)
-        )
+        fig = _bar_figure(df, x_col, y_col, title, color_col, orientation)
         st.plotly_chart(fig, use_container_width=True)
-    except Exception as e:
+    except (ValueError, KeyError, TypeError) as e:
         logger.error(f"Error creating bar chart: {e}")
         st.error(f"Failed to create bar chart: {str(e)}")
 
@@ -197,11 +356,13 @@ def create_pie_chart(df: pd.DataFrame,
         values_col: Column name for pie slice values
         title: Optional chart title
     """
+    if not _can_plot(df, "pie chart", (names_col, values_col)):
+        return
+    
     try:
-        fig = px.pie(df, names=names_col, values=values_col, title=title)
-        fig.update_traces(textposition='inside', textinfo='percent+label')
+        fig = _pie_figure(df, names_col, values_col, title)
         st.plotly_chart(fig, use_container_width=True)
-    except Exception as e:
+    except (ValueError, KeyError, TypeError) as e:
         logger.error(f"Error creating pie chart: {e}")
         st.error(f"Failed to create pie chart: {str(e)}")
 
@@ -223,15 +384,13 @@ def create_scatter_plot(df: pd.DataFrame,
         color_col: Optional column for color grouping
         size_col: Optional column for point sizes
     """
+    if not _can_plot(df, "scatter plot", (x_col, y_col), color_col, size_col):
+        return
+    
     try:
-        fig = px.scatter(df, x=x_col, y=y_col, color=color_col, size=size_col, title=title)
-        fig.update_layout(
-            xaxis_title=x_col.replace('_', ' ').title(),
-            yaxis_title=y_col.replace('_', ' ').title(),
-            showlegend=bool(color_col)
-        )
+        fig = _scatter_figure(df, x_col, y_col, title, color_col, size_col)
         st.plotly_chart(fig, use_container_width=True)
-    except Exception as e:
+    except (ValueError, KeyError, TypeError) as e:
         logger.error(f"Error creating scatter plot: {e}")
         st.error(f"Failed to create scatter plot: {str(e)}")
 
@@ -251,19 +410,149 @@ def create_area_chart(df: pd.DataFrame,
         title: Optional chart title
         color_col: Optional column for color grouping
     """
+    if not _can_plot(df, "area chart", (x_col, y_col), color_col):
+        return
+    
     try:
-        fig = px.area(df, x=x_col, y=y_col, color=color_col, title=title)
-        fig.update_layout(
-            xaxis_title=x_col.replace('_', ' ').title(),
-            yaxis_title=y_col.replace('_', ' ').title(),
-            showlegend=bool(color_col)
-        )
+        fig = _area_figure(df, x_col, y_col, title, color_col)
         st.plotly_chart(fig, use_container_width=True)
-    except Exception as e:
+    except (ValueError, KeyError, TypeError) as e:
         logger.error(f"Error creating area chart: {e}")
         st.error(f"Failed to create area chart: {str(e)}")
 
 
+# Vega-Lite variants: the spec is a plain dict built once per (columns, title), so
+# a rerun only ships the data - no figure object is built or validated at all.
+# st.vega_lite_chart fills in missing top-level keys, hence "autosize" is set
+# here and each call gets its own shallow copy.
+def _vl_field_type(series: pd.Series) -> str:
+    """Vega-Lite encoding type for a column."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return "temporal"
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return "quantitative"
+    return "nominal"
+
+
+@functools.lru_cache(maxsize=64)
+def _line_spec(x_col: str, x_type: str, y_col: str, title: Optional[str]) -> Dict[str, Any]:
+    """Vega-Lite spec for a single-series line chart."""
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "title": title or "",
+        "mark": {"type": "line", "tooltip": True},
+        "encoding": {
+            "x": {"field": x_col, "type": x_type, "title": _title(x_col)},
+            "y": {"field": y_col, "type": "quantitative", "title": _title(y_col)},
+        },
+        "autosize": {"type": "fit", "contains": "padding"},
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _pie_spec(names_col: str, values_col: str, title: Optional[str]) -> Dict[str, Any]:
+    """Vega-Lite spec for a pie chart."""
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "title": title or "",
+        "mark": {"type": "arc", "tooltip": True},
+        "encoding": {
+            "theta": {"field": values_col, "type": "quantitative", "title": _title(values_col)},
+            "color": {"field": names_col, "type": "nominal", "title": _title(names_col)},
+        },
+        "autosize": {"type": "fit", "contains": "padding"},
+    }
+
+
+def create_line_chart_vl(df: pd.DataFrame,
+                        x_col: str,
+                        y_col: str,
+                        title: Optional[str] = None) -> None:
+    """
+    Create a line chart from a prebuilt Vega-Lite spec.
+    
+    Args:
+        df: DataFrame containing the data
+        x_col: Column name for x-axis
+        y_col: Column name for y-axis
+        title: Optional chart title
+    """
+    if not _can_plot(df, "line chart", (x_col, y_col)):
+        return
+    
+    try:
+        spec = _line_spec(x_col, _vl_field_type(df[x_col]), y_col, title)
+        st.vega_lite_chart(df[[x_col, y_col]], dict(spec), use_container_width=True)
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Error creating line chart: {e}")
+        st.error(f"Failed to create line chart: {str(e)}")
+
+
+def create_pie_chart_vl(df: pd.DataFrame,
+                       names_col: str,
+                       values_col: str,
+                       title: Optional[str] = None) -> None:
+    """
+    Create a pie chart from a prebuilt Vega-Lite spec.
+    
+    Args:
+        df: DataFrame containing the data
+        names_col: Column name for pie slice labels
+        values_col: Column name for pie slice values
+        title: Optional chart title
+    """
+    if not _can_plot(df, "pie chart", (names_col, values_col)):
+        return
+    
+    try:
+        spec = _pie_spec(names_col, values_col, title)
+        st.vega_lite_chart(df[[names_col, values_col]], dict(spec), use_container_width=True)
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Error creating pie chart: {e}")
+        st.error(f"Failed to create pie chart: {str(e)}")
+
+
+def create_pie_chart_arrow(table: pa.Table,
+                          names_col: str,
+                          values_col: str,
+                          title: Optional[str] = None) -> None:
+    """
+    Create a pie chart from a prebuilt Arrow table (for static data built once
+    at import, so reruns skip the pandas-to-Arrow conversion).
+    
+    Args:
+        table: Arrow table containing the data
+        names_col: Column name for pie slice labels
+        values_col: Column name for pie slice values
+        title: Optional chart title
+    """
+    try:
+        spec = _pie_spec(names_col, values_col, title)
+        st.vega_lite_chart(table.select([names_col, values_col]), dict(spec), use_container_width=True)
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Error creating pie chart: {e}")
+        st.error(f"Failed to create pie chart: {str(e)}")
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _sidebar_schema(df: pd.DataFrame, filter_columns: tuple) -> Dict[str, tuple]:
+    """
+    Scan the filterable columns once per DataFrame.
+    
+    Returns:
+        dict: column -> ("categorical", unique values) or ("numeric", (min, max))
+    """
+    schema = {}
+    for col in filter_columns:
+        if col in df.columns:
+            series = df[col]
+            if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+                schema[col] = ("categorical", series.unique())
+            elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                schema[col] = ("numeric", (float(series.min()), float(series.max())))
+    return schema
+
+
 def create_filter_sidebar(df: pd.DataFrame,
                          filter_columns: List[str],
                          sidebar_title: str = "Filters") -> Dict[str, Any]:
@@ -283,30 +572,27 @@ def create_filter_sidebar(df: pd.DataFrame,
     with st.sidebar:
         st.subheader(sidebar_title)
         
-        for col in filter_columns:
-            if col in df.columns:
-                unique_values = df[col].unique()
+        # Column scans are cached, so reruns only rebuild the widgets
+        for col, (kind, values) in _sidebar_schema(df, tuple(filter_columns)).items():
+            if kind == "categorical":
+                # Create multiselect for categorical data
+                selected = st.multiselect(
+                    f"Select {_title(col)}:",
+                    options=values,
+                    default=values
+                )
+                filters[col] = selected
                 
-                if df[col].dtype in ['object', 'string']:
-                    # Create multiselect for categorical data
-                    selected = st.multiselect(
-                        f"Select {col.replace('_', ' ').title()}:",
-                        options=unique_values,
-                        default=unique_values
-                    )
-                    filters[col] = selected
-                    
-                elif df[col].dtype in ['int64', 'float64']:
-                    # Create slider for numeric data
-                    min_val = float(df[col].min())
-                    max_val = float(df[col].max())
-                    selected_range = st.slider(
-                        f"{col.replace('_', ' ').title()} Range:",
-                        min_value=min_val,
-                        max_value=max_val,
-                        value=(min_val, max_val)
-                    )
-                    filters[col] = selected_range
+            else:
+                # Create slider for numeric data
+                min_val, max_val = values
+                selected_range = st.slider(
+                    f"{_title(col)} Range:",
+                    min_value=min_val,
+                    max_value=max_val,
+                    value=(min_val, max_val)
+                )
+                filters[col] = selected_range
     
     return filters
 
@@ -322,22 +608,32 @@ def apply_filters(df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Filtered DataFrame
     """
-    filtered_df = df.copy()
+    # Combine every filter into one mask and index the frame once
+    mask = np.ones(len(df), dtype=bool)
+    columns = frozenset(df.columns)
     
     for col, filter_value in filters.items():
-        if col in filtered_df.columns:
+        if col in columns:
             if isinstance(filter_value, list) and filter_value:
                 # Handle multiselect filters
-                filtered_df = filtered_df[filtered_df[col].isin(filter_value)]
+                mask &= df[col].isin(filter_value).to_numpy(dtype=bool, na_value=False)
             elif isinstance(filter_value, tuple) and len(filter_value) == 2:
                 # Handle range filters
                 min_val, max_val = filter_value
-                filtered_df = filtered_df[
-                    (filtered_df[col] >= min_val) & 
-                    (filtered_df[col] <= max_val)
-                ]
+                mask &= df[col].between(min_val, max_val).to_numpy(dtype=bool, na_value=False)
+    
+    # Nothing filtered out (no selections, or full ranges) - hand back the frame itself
+    if mask.all():
+        return df
     
-    return filtered_df
+    return df[mask]
+
+
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame as UTF-8 CSV bytes."""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue()
 
 
 def create_download_button(df: pd.DataFrame,
@@ -354,7 +650,9 @@ def create_download_button(df: pd.DataFrame,
         mime_type: MIME type for the download
     """
     try:
-        csv_data = df.to_csv(index=False)
+        # Encoded straight to bytes on every call; a cache keyed on the frame
+        # could serve stale bytes for large frames, which st hashes by sampling
+        csv_data = _csv_bytes(df)
         st.download_button(
             label=button_text,
             data=csv_data,
@@ -366,12 +664,14 @@ def create_download_button(df: pd.DataFrame,
         st.error(f"Failed to create download button: {str(e)}")
 
 
-def show_data_info(df: pd.DataFrame) -> None:
+def show_data_info(df: pd.DataFrame, deep: bool = False) -> None:
     """
     Show information about a DataFrame.
     
     Args:
         df: DataFrame to analyze
+        deep: Include the size of object-column contents in memory_usage
+            (scans every element, so it is slow on wide text-heavy frames)
     """
     with st.expander("📊 Data Information"):
         col1, col2, col3 = st.columns(3)
@@ -381,32 +681,35 @@ def show_data_info(df: pd.DataFrame) -> None:
         with col2:
             st.metric("Columns", len(df.columns))
         with col3:
-            st.metric("Memory Usage", f"{df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+            st.metric("Memory Usage", f"{df.memory_usage(deep=deep).sum() / 1024**2:.2f} MB")
         
-        # Show column info
+        # Show column info (null mask counted once, shared by both null columns)
         st.subheader("Column Information")
+        null_counts = df.isnull().sum()
         info_df = pd.DataFrame({
             'Column': df.columns,
             'Data Type': df.dtypes.astype(str),
-            'Null Count': df.isnull().sum(),
-            'Null %': (df.isnull().sum() / len(df) * 100).round(2)
+            'Null Count': null_counts,
+            'Null %': (null_counts / len(df) * 100).round(2)
         })
         st.dataframe(info_df, use_container_width=True)
 
 
+_ALERTS = {
+    'success': st.success,
+    'warning': st.warning,
+    'error': st.error,
+    'info': st.info,
+}
+
+
 def create_alert(message: str, alert_type: str = "info") -> None:
     """
     Create a styled alert message.
     
     Args:
         message: Alert message
-        alert_type: Type of alert ('info', 'success', 'warning', 'error')
-    """
-    if alert_type == "success":
-        st.success(message)
-    elif alert_type == "warning":
-        st.warning(message)
-    elif alert_type == "error":
-        st.error(message)
-    else:
-        st.info(message) 
\ No newline at end of file
+        alert_type: Type of alert ('info', 'success', 'warning', 'error');
+            anything else renders as info
+    """
+    _ALERTS.get(alert_type, st.info)(message) 
\ No newline at end of file
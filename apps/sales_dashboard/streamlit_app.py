@@ -4,12 +4,12 @@ Sales Dashboard - Self-contained Streamlit app with local utilities
 import streamlit as st
 import pandas as pd
 import numpy as np
-from snowflake.snowpark.context import get_active_session
+import pyarrow as pa
 
 # Simple local imports - no path manipulation needed
-from common.snowflake_utils import get_active_session_connection
-from common.ui_components import display_metric, create_line_chart, create_pie_chart, display_dataframe
-from common.data_utils import generate_sample_data
+from common.snowflake_utils import resolve_connection
+from common.ui_components import create_line_chart_vl, create_pie_chart_arrow, display_dataframe
+from common.data_utils import calculate_growth_rate, generate_sample_data
 
 st.set_page_config(
     page_title="Sales Dashboard",
@@ -18,13 +18,89 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Constant inputs shared across reruns
+_METRICS = (
+    ("Total Revenue", "$2.4M", "12%"),
+    ("Orders", "1,234", "8%"),
+    ("Customers", "856", "15%"),
+    ("Avg Order", "$1,943", "-3%"),
+)
+_REGIONS = ("All", "North", "South", "East", "West", "Central")
+_REGIONAL_DATA = pd.DataFrame({
+    'region': ['North', 'South', 'East', 'West', 'Central'],
+    'sales': [450000, 380000, 520000, 290000, 360000]
+})
+_REGIONAL_TABLE = pa.Table.from_pandas(_REGIONAL_DATA, preserve_index=False)
+
+_ORDER_IDS = pd.array(np.char.add('ORD-', (1000 + np.arange(10)).astype(str)), dtype='string[pyarrow]')
+_ORDER_CUSTOMERS = pd.array(np.char.add('Customer ', (np.arange(10) + 1).astype(str)), dtype='string[pyarrow]')
+_ORDER_PRODUCTS = pd.Categorical(np.tile(['Product A', 'Product B', 'Product C'], 4)[:10])
+_ORDER_DATES = pd.date_range('2024-01-01', periods=10, freq='D')
+_ORDER_COLUMNS = {
+    'Amount': st.column_config.NumberColumn(format="$%.2f"),
+    'Status': st.column_config.TextColumn(),
+}
+
+@st.cache_data(show_spinner=False)
+def _recent_orders(seed: int = 0) -> pd.DataFrame:
+    """Latest orders for the Recent Orders table (seeded, so the cached frame never goes stale)."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Order ID': _ORDER_IDS,
+        'Customer': _ORDER_CUSTOMERS,
+        'Product': _ORDER_PRODUCTS,
+        'Amount': rng.uniform(100, 5000, 10).round(2),
+        'Date': _ORDER_DATES,
+        'Status': pd.Categorical(rng.choice(['Completed', 'Processing', 'Shipped'], 10))
+    })
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _trend_bundle(as_of: pd.Timestamp) -> tuple:
+    """90 days of sample sales with running revenue, plus the forecast stats from the same pass."""
+    trend_data = generate_sample_data(90, as_of)
+    revenue = trend_data['revenue'].to_numpy(dtype=np.float64)
+    
+    # Three consecutive 30-day totals: oldest, previous, latest
+    oldest, previous, latest = revenue.reshape(3, 30).sum(axis=1)
+    growth = calculate_growth_rate(latest, previous)
+    stats = {
+        'growth': growth,
+        'growth_change': growth - calculate_growth_rate(previous, oldest),
+        'forecast': latest * (1 + growth),
+    }
+    return trend_data.assign(cumulative=revenue.cumsum()), stats
+
+@st.cache_resource(show_spinner=False)
 def get_snowflake_connection():
-    """Get Snowflake connection - works in SIS"""
-    try:
-        return get_active_session_connection()
-    except:
-        # Fallback for local development would go here
-        return get_active_session()
+    """Get Snowflake connection - SIS session first, then the local Snow CLI connection (resolved once per process)"""
+    return resolve_connection("streamlit_env")
+
+@st.fragment
+def _performance_tab(as_of: pd.Timestamp):
+    """Weekly order volume"""
+    st.write("**Performance Metrics**")
+    perf_data = generate_sample_data(7, as_of)
+    create_line_chart_vl(perf_data, "date", "orders", "Weekly Orders")
+
+@st.fragment
+def _trends_tab(as_of: pd.Timestamp):
+    """Cumulative revenue over the last 90 days"""
+    st.write("**Sales Trends**")
+    trend_data, _ = _trend_bundle(as_of)
+    create_line_chart_vl(trend_data, "date", "cumulative", "Cumulative Revenue")
+
+@st.fragment
+def _forecasting_tab(as_of: pd.Timestamp):
+    """Headline forecast metrics"""
+    st.write("**Revenue Forecasting**")
+    _, stats = _trend_bundle(as_of)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("30-Day Forecast", f"${stats['forecast']:,.0f}", f"{stats['growth']:.1%}")
+    with col2:
+        st.metric("Growth Rate", f"{stats['growth']:.1%}", f"{stats['growth_change']:.1%}")
+    with col3:
+        st.metric("Confidence", "94%", "1.2%")
 
 def main():
     """Sales Dashboard Application"""
@@ -39,77 +115,59 @@ def main():
         if st.button("Test Connection"):
             try:
                 conn = get_snowflake_connection()
-                if hasattr(conn, 'test_connection') and conn.test_connection():
+                if conn.test_connection():
+                    # Context captured when the cached connection was created
                     st.success("✅ Connected to Snowflake!")
-                    st.write(f"**Database:** {conn.current_database}")
-                    st.write(f"**Schema:** {conn.current_schema}")
-                    st.write(f"**Warehouse:** {conn.current_warehouse}")
+                    st.write(f"**Database:** {conn.database}")
+                    st.write(f"**Schema:** {conn.schema}")
+                    st.write(f"**Warehouse:** {conn.warehouse}")
                 else:
-                    # Direct session test
-                    session = get_active_session()
-                    st.success("✅ Connected to Snowflake!")
-                    st.write(f"**Database:** {session.get_current_database()}")
-                    st.write(f"**Schema:** {session.get_current_schema()}")
-                    st.write(f"**Warehouse:** {session.get_current_warehouse()}")
+                    st.error("❌ Connection test failed")
             except Exception as e:
                 st.error(f"❌ Connection error: {e}")
         
-        # Filters
+        # Filters (default period computed once per session)
+        if 'date_default' not in st.session_state:
+            now = pd.Timestamp.now()
+            st.session_state.date_default = (now - pd.Timedelta(days=30), now)
         date_range = st.date_input(
             "Date Range",
-            value=(pd.Timestamp.now() - pd.Timedelta(days=30), pd.Timestamp.now())
+            value=st.session_state.date_default
         )
         
-        regions = ["All", "North", "South", "East", "West", "Central"]
-        selected_region = st.selectbox("Region", regions)
+        selected_region = st.selectbox("Region", _REGIONS)
         
         if st.button("🔄 Refresh Data"):
             st.rerun()
     
-    # Main metrics using nice utility functions
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        display_metric("Total Revenue", "$2.4M", "12%")
-    with col2:
-        display_metric("Orders", "1,234", "8%")
-    with col3:
-        display_metric("Customers", "856", "15%")
-    with col4:
-        display_metric("Avg Order", "$1,943", "-3%")
+    # Main metrics
+    for col, metric in zip(st.columns(4), _METRICS):
+        col.metric(*metric)
     
     st.markdown("---")
     
-    # Charts using nice utility functions
+    # Charts using nice utility functions; sample data is keyed on a
+    # 5-minute bucket so reruns reuse the cached frames
+    as_of = pd.Timestamp.now().floor('5min')
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("📈 Revenue Trend")
-        sample_data = generate_sample_data(30)
-        create_line_chart(sample_data, "date", "revenue", "Daily Revenue")
+        sample_data = generate_sample_data(30, as_of)
+        create_line_chart_vl(sample_data, "date", "revenue", "Daily Revenue")
     
     with col2:
         st.subheader("🥧 Sales by Region")
-        regional_data = pd.DataFrame({
-            'region': ['North', 'South', 'East', 'West', 'Central'],
-            'sales': [450000, 380000, 520000, 290000, 360000]
-        })
-        create_pie_chart(regional_data, "region", "sales", "Regional Sales")
+        create_pie_chart_arrow(_REGIONAL_TABLE, "region", "sales", "Regional Sales")
     
     st.markdown("---")
     
     # Data table using nice utility
     st.subheader("📋 Recent Orders")
-    orders_data = pd.DataFrame({
-        'Order ID': [f'ORD-{1000+i}' for i in range(10)],
-        'Customer': [f'Customer {i+1}' for i in range(10)],
-        'Product': ['Product A', 'Product B', 'Product C'] * 3 + ['Product A'],
-        'Amount': np.random.uniform(100, 5000, 10).round(2),
-        'Date': pd.date_range('2024-01-01', periods=10, freq='D'),
-        'Status': np.random.choice(['Completed', 'Processing', 'Shipped'], 10)
-    })
+    orders_data = _recent_orders(0)
     
-    display_dataframe(orders_data, height=300, use_container_width=True)
+    display_dataframe(orders_data, height=300, use_container_width=True,
+                      column_config=_ORDER_COLUMNS, hide_index=True)
     
     # Advanced analytics tabs
     st.markdown("---")
@@ -118,25 +176,13 @@ def main():
     tab1, tab2, tab3 = st.tabs(["Performance", "Trends", "Forecasting"])
     
     with tab1:
-        st.write("**Performance Metrics**")
-        perf_data = generate_sample_data(7)
-        create_line_chart(perf_data, "date", "orders", "Weekly Orders")
+        _performance_tab(as_of)
     
     with tab2:
-        st.write("**Sales Trends**")
-        trend_data = generate_sample_data(90)
-        trend_data['cumulative'] = trend_data['revenue'].cumsum()
-        create_line_chart(trend_data, "date", "cumulative", "Cumulative Revenue")
+        _trends_tab(as_of)
     
     with tab3:
-        st.write("**Revenue Forecasting**")
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("30-Day Forecast", "$2.8M", "16.7%")
-        with col2:
-            st.metric("Growth Rate", "12.3%", "2.1%")
-        with col3:
-            st.metric("Confidence", "94%", "1.2%")
+        _forecasting_tab(as_of)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
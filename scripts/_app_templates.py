@@ -0,0 +1,74 @@
+"""
+Deployment config templates used by create_app.py.
+
+snowflake.yml and environment.yml have a fixed schema where only the app
+name and the template's dependency list vary, so they are written directly
+from these strings rather than emitted through a YAML library.
+"""
+
+SNOWFLAKE_YML_TMPL = """\
+definition_version: '2'
+entities:
+  {name}_app:
+    artifacts:
+    - streamlit_app.py
+    - environment.yml
+    - pages/
+    - config/
+    - common/
+    identifier:
+      name: {name}_app
+    main_file: streamlit_app.py
+    pages_dir: pages
+    query_warehouse: COMPUTE_WH
+    stage: streamlit
+    type: streamlit
+"""
+
+ENVIRONMENT_YML_TMPL = """\
+channels:
+- snowflake
+- conda-forge
+- defaults
+dependencies:
+{dependencies}
+name: streamlit_{name}_env
+"""
+
+# Everything the copied common/ package imports, with the same Streamlit floor
+# as the existing apps' environment.yml
+BASE_DEPENDENCIES = (
+    'streamlit>=1.37.0',
+    'snowflake-snowpark-python>=1.11.0',
+    'pandas>=2.0.0',
+    'plotly>=6.0.0',
+    'orjson>=3.9.0',
+    'pydantic>=2.0.0',
+    'toml>=0.10.2',
+    'cryptography>=3.4.8'
+)
+
+# Template-specific dependencies
+TEMPLATE_DEPENDENCIES = {
+    'basic': (),
+    'analytics': (
+        'numpy>=1.24.0',
+        'scipy>=1.11.0',
+        'scikit-learn>=1.3.0'
+    ),
+    'dashboard': (
+        'altair>=5.0.0',
+        'seaborn>=0.12.0',
+        'matplotlib-base>=3.7.0'
+    ),
+    'ml': (
+        'numpy>=1.24.0',
+        'scipy>=1.11.0',
+        'scikit-learn>=1.3.0',
+        'joblib>=1.3.0'
+    )
+}
+
+DEPENDENCIES_BY_TEMPLATE = {
+    template: BASE_DEPENDENCIES + extra for template, extra in TEMPLATE_DEPENDENCIES.items()
+}
@@ -10,9 +10,12 @@ import subprocess
 import argparse
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from deploy_from_git import GitStreamlitDeployer
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,59 +27,72 @@ class DeploymentError(Exception):
     """Custom exception for deployment errors"""
     pass
 
+def _entry_names(directory: Path) -> set:
+    """Names in a directory from a single scandir (empty if it does not exist)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
 class CIDeployer:
     """Handles CI/CD style deployments for testing GitHub Action logic"""
     
-    def __init__(self, connection: str = "streamlit_env", dry_run: bool = False):
+    def __init__(self, connection: str = "streamlit_env", dry_run: bool = False, max_parallel: int = 4):
         self.connection = connection
         self.dry_run = dry_run
+        self.max_parallel = max(1, max_parallel)
         self.repo_root = Path(__file__).parent.parent
+        self._validated: Dict[str, bool] = {}
+        self._changed_cache: Dict[tuple, List[str]] = {}
+        # Drive deploy_from_git in-process rather than spawning a Python interpreter per call
+        self.git_deployer = GitStreamlitDeployer(self.repo_root, connection=connection)
         
+    def _git(self, *args: str) -> List[str]:
+        """Run a read-only git command and return its NUL-separated output (empty on failure)"""
+        result = subprocess.run(
+            ["git", *args], capture_output=True, text=True, cwd=self.repo_root,
+            stdin=subprocess.DEVNULL, env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"}, check=False
+        )
+        if result.returncode != 0:
+            return []
+        return [path for path in result.stdout.split('\0') if path]
+    
     def get_changed_apps(self, base_branch: str = "main") -> List[str]:
         """
         Get list of apps that have changed files
-        Checks both staged and unstaged changes
+        Checks both staged and unstaged changes; cached per (base branch, HEAD commit)
         """
         try:
-            changed_files = set()
-            
-            # Get staged changes
-            result = subprocess.run([
-                "git", "diff", "--name-only", "--cached"
-            ], capture_output=True, text=True, cwd=self.repo_root)
+            head = "".join(self._git("rev-parse", "HEAD")).strip()
+            cache_key = (base_branch, head)
+            if cache_key in self._changed_cache:
+                return list(self._changed_cache[cache_key])
             
-            if result.returncode == 0 and result.stdout.strip():
-                staged_files = result.stdout.strip().split('\n')
-                changed_files.update(staged_files)
-            
-            # Get unstaged changes
-            result = subprocess.run([
-                "git", "diff", "--name-only"
-            ], capture_output=True, text=True, cwd=self.repo_root)
+            changed_files = set()
             
-            if result.returncode == 0 and result.stdout.strip():
-                unstaged_files = result.stdout.strip().split('\n')
-                changed_files.update(unstaged_files)
+            # Staged and unstaged changes in one pass: "XY path" entries, NUL-separated;
+            # renames/copies carry the original path as an extra entry, which we skip
+            entries = iter(self._git("status", "--porcelain", "-z", "--untracked-files=no"))
+            for entry in entries:
+                changed_files.add(entry[3:])
+                if {"R", "C"} & set(entry[:2]):
+                    next(entries, None)
             
             # Get changes between branches (for PR scenarios)
-            result = subprocess.run([
-                "git", "diff", "--name-only", f"origin/{base_branch}...HEAD"
-            ], capture_output=True, text=True, cwd=self.repo_root)
-            
-            if result.returncode == 0 and result.stdout.strip():
-                branch_files = result.stdout.strip().split('\n')
-                changed_files.update(branch_files)
+            changed_files.update(self._git("diff", "--name-only", "-z", f"origin/{base_branch}...HEAD"))
             
-            changed_files = list(changed_files)
-            logger.info(f"Changed files: {changed_files}")
+            logger.info(f"Changed files: {sorted(changed_files)}")
             
-            # Extract app names from changed files
+            # Extract app names from changed files (apps/<app_name>/...)
             changed_apps = set()
             for file_path in changed_files:
-                if file_path.startswith('apps/') and '/' in file_path[5:]:
-                    app_name = file_path.split('/')[1]
+                top, _, rest = file_path.partition('/')
+                app_name, sep, _ = rest.partition('/')
+                if sep and app_name and top == 'apps':
                     changed_apps.add(app_name)
             
+            self._changed_cache[cache_key] = list(changed_apps)
             return list(changed_apps)
             
         except Exception as e:
@@ -89,15 +105,22 @@ class CIDeployer:
         if not apps_dir.exists():
             return []
         
-        apps = []
-        for item in apps_dir.iterdir():
-            if item.is_dir() and (item / "streamlit_app.py").exists():
-                apps.append(item.name)
-        
-        return apps
+        # DirEntry.is_dir() comes from the directory read itself; only the main file needs a stat
+        with os.scandir(apps_dir) as entries:
+            return [
+                entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and os.path.isfile(os.path.join(entry.path, "streamlit_app.py"))
+            ]
     
     def validate_app(self, app_name: str) -> bool:
-        """Validate that an app is ready for deployment"""
+        """Validate that an app is ready for deployment (checked once per run)"""
+        if app_name not in self._validated:
+            self._validated[app_name] = self._check_required_files(app_name)
+        return self._validated[app_name]
+    
+    def _check_required_files(self, app_name: str) -> bool:
+        """Check the app's required files against one directory listing per directory"""
         app_dir = self.repo_root / "apps" / app_name
         
         # Check required files
@@ -109,8 +132,12 @@ class CIDeployer:
             "common/data_utils.py"
         ]
         
+        present = _entry_names(app_dir)
+        if "common" in present:
+            present |= {f"common/{name}" for name in _entry_names(app_dir / "common")}
+        
         for file_path in required_files:
-            if not (app_dir / file_path).exists():
+            if file_path not in present:
                 logger.error(f"App {app_name} missing required file: {file_path}")
                 return False
         
@@ -129,26 +156,12 @@ class CIDeployer:
             return True
         
         try:
-            # Use our existing deployment script
-            deploy_script = self.repo_root / "scripts" / "deploy_from_git.py"
-            
-            cmd = [
-                "python", str(deploy_script),
-                "--app", app_name,
-                "--branch", branch,
-                "--connection", self.connection
-            ]
-            
-            logger.info(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.repo_root)
-            
-            if result.returncode == 0:
+            # Use our existing deployment logic
+            if self.git_deployer.create_streamlit_from_git(app_name, branch):
                 logger.info(f"Successfully deployed {app_name}")
-                logger.info(f"Output: {result.stdout}")
                 return True
             else:
                 logger.error(f"Failed to deploy {app_name}")
-                logger.error(f"Error: {result.stderr}")
                 return False
                 
         except Exception as e:
@@ -164,27 +177,23 @@ class CIDeployer:
             return True
         
         try:
-            deploy_script = self.repo_root / "scripts" / "deploy_from_git.py"
-            
-            cmd = [
-                "python", str(deploy_script),
-                "--sync",
-                "--connection", self.connection
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.repo_root)
-            
-            if result.returncode == 0:
+            if self.git_deployer.sync_from_git():
                 logger.info("Successfully synced git repository")
                 return True
             else:
-                logger.error(f"Failed to sync git repository: {result.stderr}")
+                logger.error("Failed to sync git repository")
                 return False
                 
         except Exception as e:
             logger.error(f"Exception syncing repository: {e}")
             return False
     
+    def _deploy_many(self, apps: List[str], branch: str) -> Dict[str, bool]:
+        """Deploy independent apps concurrently, at most max_parallel at a time"""
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+            futures = {app_name: executor.submit(self.deploy_app, app_name, branch) for app_name in apps}
+            return {app_name: future.result() for app_name, future in futures.items()}
+    
     def deploy_changed_apps(self, base_branch: str = "main", current_branch: str = "main") -> Dict[str, bool]:
         """Deploy all changed apps"""
         changed_apps = self.get_changed_apps(base_branch)
@@ -200,11 +209,7 @@ class CIDeployer:
             raise DeploymentError("Failed to sync git repository")
         
         # Deploy each changed app
-        results = {}
-        for app_name in changed_apps:
-            results[app_name] = self.deploy_app(app_name, current_branch)
-        
-        return results
+        return self._deploy_many(changed_apps, current_branch)
     
     def deploy_all_apps(self, branch: str = "main") -> Dict[str, bool]:
         """Deploy all apps"""
@@ -221,11 +226,7 @@ class CIDeployer:
             raise DeploymentError("Failed to sync git repository")
         
         # Deploy each app
-        results = {}
-        for app_name in all_apps:
-            results[app_name] = self.deploy_app(app_name, branch)
-        
-        return results
+        return self._deploy_many(all_apps, branch)
 
 def main():
     parser = argparse.ArgumentParser(description='CI/CD Deployment Script for Streamlit Apps')
@@ -237,10 +238,11 @@ def main():
     parser.add_argument('--connection', default='streamlit_env', help='Snowflake connection')
     parser.add_argument('--dry-run', action='store_true', help='Perform dry run without actual deployment')
     parser.add_argument('--validate-only', action='store_true', help='Only validate apps, no deployment')
+    parser.add_argument('--max-parallel', type=int, default=4, help='Maximum number of apps to deploy concurrently')
     
     args = parser.parse_args()
     
-    deployer = CIDeployer(connection=args.connection, dry_run=args.dry_run)
+    deployer = CIDeployer(connection=args.connection, dry_run=args.dry_run, max_parallel=args.max_parallel)
     
     try:
         if args.validate_only:
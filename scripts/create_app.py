@@ -6,14 +6,22 @@ This script creates new Streamlit app structures with proper
 configuration files and templates.
 """
 
-import argparse
 import os
+import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
-import yaml
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+from _app_templates import (
+    BASE_DEPENDENCIES,
+    DEPENDENCIES_BY_TEMPLATE,
+    ENVIRONMENT_YML_TMPL,
+    SNOWFLAKE_YML_TMPL,
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,150 +29,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Letters, digits and underscores, with at least one letter or digit
+_APP_NAME_RE = re.compile(r'(?=.*[A-Za-z0-9])[A-Za-z0-9_]+\Z')
 
-class AppCreator:
-    """Creates new Streamlit application structures."""
-    
-    def __init__(self, project_root: Path):
-        self.project_root = project_root
-        self.apps_dir = project_root / "apps"
-        self.templates_dir = project_root / "templates"
-        
-    def create_app_directory(self, app_name: str) -> Path:
-        """Create the app directory structure."""
-        app_dir = self.apps_dir / app_name
-        
-        if app_dir.exists():
-            raise ValueError(f"App directory already exists: {app_dir}")
-            
-        # Create directory structure
-        directories = [
-            app_dir,
-            app_dir / "pages",
-            app_dir / "config",
-            app_dir / "tests"
-        ]
-        
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created directory: {directory}")
-            
-        return app_dir
-    
-    def create_snowflake_config(self, app_dir: Path, app_name: str, 
-                               template: str = "basic") -> None:
-        """Create snowflake.yml configuration file."""
-        
-        config = {
-            'definition_version': '2',
-            'entities': {
-                f'{app_name}_app': {
-                    'type': 'streamlit',
-                    'identifier': {
-                        'name': f'{app_name}_app'
-                    },
-                    'main_file': 'streamlit_app.py',
-                    'pages_dir': 'pages',
-                    'query_warehouse': 'COMPUTE_WH',
-                    'stage': 'streamlit',
-                    'artifacts': [
-                        'streamlit_app.py',
-                        'environment.yml',
-                        'pages/',
-                        'config/',
-                        '../../shared/'  # Include shared utilities
-                    ]
-                }
-            }
-        }
-        
-        config_file = app_dir / "snowflake.yml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, indent=2)
-            
-        logger.info(f"Created Snowflake config: {config_file}")
-    
-    def create_environment_config(self, app_dir: Path, template: str = "basic") -> None:
-        """Create environment.yml file."""
-        
-        base_deps = [
-            'streamlit>=1.28.0',
-            'snowflake-snowpark-python>=1.11.0',
-            'pandas>=2.0.0',
-            'plotly>=5.0.0'
-        ]
-        
-        # Add template-specific dependencies
-        template_deps = {
-            'basic': [],
-            'analytics': [
-                'numpy>=1.24.0',
-                'scipy>=1.11.0',
-                'scikit-learn>=1.3.0'
-            ],
-            'dashboard': [
-                'altair>=5.0.0',
-                'seaborn>=0.12.0',
-                'matplotlib-base>=3.7.0'
-            ],
-            'ml': [
-                'numpy>=1.24.0',
-                'scipy>=1.11.0',
-                'scikit-learn>=1.3.0',
-                'joblib>=1.3.0'
-            ]
-        }
-        
-        dependencies = base_deps + template_deps.get(template, [])
-        
-        config = {
-            'name': f'streamlit_{app_dir.name}_env',
-            'channels': ['snowflake', 'conda-forge', 'defaults'],
-            'dependencies': dependencies
-        }
-        
-        env_file = app_dir / "environment.yml"
-        with open(env_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, indent=2)
-            
-        logger.info(f"Created environment config: {env_file}")
-    
-    def create_main_app(self, app_dir: Path, app_name: str, template: str = "basic") -> None:
-        """Create the main streamlit_app.py file."""
-        
-        templates = {
-            'basic': self._get_basic_template(app_name),
-            'analytics': self._get_analytics_template(app_name),
-            'dashboard': self._get_dashboard_template(app_name),
-            'ml': self._get_ml_template(app_name)
-        }
-        
-        content = templates.get(template, templates['basic'])
-        
-        app_file = app_dir / "streamlit_app.py"
-        with open(app_file, 'w') as f:
-            f.write(content)
-            
-        logger.info(f"Created main app file: {app_file}")
-    
-    def create_sample_page(self, app_dir: Path, app_name: str) -> None:
-        """Create a sample page."""
-        
-        content = f'''import streamlit as st
-import sys
-from pathlib import Path
 
-# Add shared utilities to path
-shared_path = Path(__file__).parent.parent.parent / "shared"
-sys.path.insert(0, str(shared_path))
+def _app_title(app_name: str) -> str:
+    """Human-readable title for an app name, e.g. sales_dashboard -> Sales Dashboard."""
+    return app_name.replace('_', ' ').title()
 
-from shared.common import snowflake_utils, ui_components
 
-st.set_page_config(
-    page_title="{app_name.replace('_', ' ').title()} - Details",
-    page_icon="📊",
-    layout="wide"
-)
+# Bodies of the generated page, config, README and test files, rendered
+# with str.format (literal braces are doubled)
+SAMPLE_PAGE_TMPL = '''import streamlit as st
+
+from common import snowflake_utils, ui_components
+
+if st.session_state.get("_page_config") != "details":
+    st.set_page_config(
+        page_title="{app_title} - Details",
+        page_icon="📊",
+        layout="wide"
+    )
+    st.session_state["_page_config"] = "details"
+
+@st.cache_resource(show_spinner=False)
+def get_snowflake_connection():
+    """Snowflake connection created once per process and shared by every rerun."""
+    return snowflake_utils.get_connection()
 
 st.title("Details Page")
 
@@ -172,7 +63,11 @@ st.write("This is a sample details page for the {app_name} application.")
 
 # Example of using shared utilities
 if st.button("Test Connection"):
-    if snowflake_utils.test_connection():
+    try:
+        connected = get_snowflake_connection().test_connection()
+    except Exception:
+        connected = False
+    if connected:
         ui_components.create_alert("Connection successful!", "success")
     else:
         ui_components.create_alert("Connection failed!", "error")
@@ -188,24 +83,15 @@ import pandas as pd
 df = pd.DataFrame(sample_data)
 ui_components.create_data_table(df, "Sample Metrics")
 '''
-        
-        page_file = app_dir / "pages" / "details.py"
-        with open(page_file, 'w') as f:
-            f.write(content)
-            
-        logger.info(f"Created sample page: {page_file}")
-    
-    def create_config_file(self, app_dir: Path, app_name: str) -> None:
-        """Create app configuration file."""
-        
-        content = f'''"""
+
+CONFIG_TMPL = '''"""
 Configuration for {app_name} application.
 """
 
 # App metadata
 APP_NAME = "{app_name}"
-APP_TITLE = "{app_name.replace('_', ' ').title()}"
-APP_DESCRIPTION = "A Streamlit application for {app_name.replace('_', ' ')}"
+APP_TITLE = "{app_title}"
+APP_DESCRIPTION = "A Streamlit application for {app_words}"
 
 # Database configuration
 DEFAULT_WAREHOUSE = "COMPUTE_WH"
@@ -229,17 +115,8 @@ ENABLE_EXPORT = True
 DEFAULT_CHART_HEIGHT = 400
 DEFAULT_TABLE_HEIGHT = 300
 '''
-        
-        config_file = app_dir / "config" / "config.py"
-        with open(config_file, 'w') as f:
-            f.write(content)
-            
-        logger.info(f"Created config file: {config_file}")
-    
-    def create_readme(self, app_dir: Path, app_name: str, template: str) -> None:
-        """Create README file for the app."""
-        
-        content = f'''# {app_name.replace('_', ' ').title()}
+
+README_TMPL = '''# {app_title}
 
 A Streamlit application built with the {template} template.
 
@@ -301,7 +178,7 @@ See `environment.yml` for the complete list of dependencies.
 
 1. Create a new Python file in the `pages/` directory
 2. Follow the naming convention: `page_name.py`
-3. Import shared utilities from the project root
+3. Import shared utilities from the local `common` package
 
 ### Modifying Configuration
 
@@ -311,39 +188,38 @@ Update `config/config.py` to modify app settings and feature flags.
 
 For issues or questions, please refer to the main project documentation.
 '''
-        
-        readme_file = app_dir / "README.md"
-        with open(readme_file, 'w') as f:
-            f.write(content)
-            
-        logger.info(f"Created README: {readme_file}")
-    
-    def create_test_file(self, app_dir: Path, app_name: str) -> None:
-        """Create a basic test file."""
-        
-        content = f'''"""
-Tests for {app_name} application.
-"""
 
-import pytest
-import sys
-from pathlib import Path
+# pytest puts the app directory on sys.path itself (pytest>=7)
+PYTEST_INI = """[pytest]
+pythonpath = .
+testpaths = tests
+"""
 
-# Add app directory to path
-app_path = Path(__file__).parent.parent
-sys.path.insert(0, str(app_path))
+CONFTEST_TMPL = '''"""
+Shared pytest fixtures for {app_name} tests.
+"""
 
-# Add shared utilities to path
-shared_path = Path(__file__).parent.parent.parent / "shared"
-sys.path.insert(0, str(shared_path))
+import pytest
 
-def test_app_imports():
-    """Test that the app can be imported without errors."""
+@pytest.fixture(scope="session")
+def app_module():
+    """Import streamlit_app once and share it across tests."""
     try:
         import streamlit_app
-        assert True
     except ImportError as e:
         pytest.fail(f"Failed to import streamlit_app: {{e}}")
+    return streamlit_app
+'''
+
+TEST_TMPL = '''"""
+Tests for {app_name} application.
+"""
+
+import pytest
+
+def test_app_imports(app_module):
+    """Test that the app can be imported without errors."""
+    assert hasattr(app_module, "main")
 
 def test_config_imports():
     """Test that config can be imported."""
@@ -356,38 +232,42 @@ def test_config_imports():
 def test_shared_utilities():
     """Test that shared utilities can be imported."""
     try:
-        from shared.common import snowflake_utils, ui_components
+        from common import snowflake_utils, ui_components
         assert True
     except ImportError as e:
         pytest.fail(f"Failed to import shared utilities: {{e}}")
 
 # Add more specific tests here as needed
 '''
-        
-        test_file = app_dir / "tests" / f"test_{app_name}.py"
-        with open(test_file, 'w') as f:
-            f.write(content)
-            
-        logger.info(f"Created test file: {test_file}")
-    
-    def _get_basic_template(self, app_name: str) -> str:
-        """Get basic app template."""
-        return f'''import streamlit as st
-import sys
-from pathlib import Path
 
-# Add shared utilities to path
-shared_path = Path(__file__).parent.parent / "shared"
-sys.path.insert(0, str(shared_path))
+
+# Main streamlit_app.py for each template. These contain no placeholders,
+# so they are written verbatim and need no brace escaping
+BASIC_APP_TMPL = '''import streamlit as st
 
 # Import shared utilities
-from shared.common import snowflake_utils, ui_components, data_utils
+from common import snowflake_utils, ui_components, data_utils
 
 # Import app configuration
 from config.config import PAGE_CONFIG, APP_TITLE, APP_DESCRIPTION
 
-# Configure the page
-st.set_page_config(**PAGE_CONFIG)
+# Configure the page once per session; reruns keep the applied config
+if st.session_state.get("_page_config") != "main":
+    st.set_page_config(**PAGE_CONFIG)
+    st.session_state["_page_config"] = "main"
+
+@st.cache_resource(show_spinner=False)
+def get_snowflake_connection():
+    """Snowflake connection created once per process and shared by every rerun."""
+    return snowflake_utils.get_connection()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def connection_ok() -> bool:
+    """Connection status, checked at most once a minute instead of on every rerun."""
+    try:
+        return get_snowflake_connection().test_connection()
+    except Exception:
+        return False
 
 def main():
     """Main application function."""
@@ -397,7 +277,7 @@ def main():
     # Test connection
     with st.sidebar:
         st.header("Connection Status")
-        if snowflake_utils.test_connection():
+        if connection_ok():
             ui_components.create_alert("✅ Connected to Snowflake", "success")
         else:
             ui_components.create_alert("❌ Connection failed", "error")
@@ -407,11 +287,11 @@ def main():
     st.write("This is your new Streamlit application.")
     
     # Sample metrics
-    sample_metrics = {{
+    sample_metrics = {
         "total_records": 1000,
         "active_users": 250,
         "daily_sessions": 500
-    }}
+    }
     
     ui_components.display_metrics(sample_metrics)
     
@@ -422,28 +302,31 @@ def main():
             df = data_utils.load_data(query)
             ui_components.create_data_table(df, "Sample Data")
         except Exception as e:
-            st.error(f"Error loading data: {{e}}")
+            st.error(f"Error loading data: {e}")
 
 if __name__ == "__main__":
     main()
 '''
-    
-    def _get_analytics_template(self, app_name: str) -> str:
-        """Get analytics app template."""
-        return f'''import streamlit as st
+
+ANALYTICS_APP_TMPL = '''import streamlit as st
 import pandas as pd
 import numpy as np
-import sys
-from pathlib import Path
-
-# Add shared utilities to path
-shared_path = Path(__file__).parent.parent / "shared"
-sys.path.insert(0, str(shared_path))
 
-from shared.common import snowflake_utils, ui_components, data_utils
+from common import snowflake_utils, ui_components, data_utils
 from config.config import PAGE_CONFIG, APP_TITLE
 
-st.set_page_config(**PAGE_CONFIG)
+if st.session_state.get("_page_config") != "main":
+    st.set_page_config(**PAGE_CONFIG)
+    st.session_state["_page_config"] = "main"
+
+@st.cache_data(show_spinner=False)
+def _trend_df(seed: int = 0) -> pd.DataFrame:
+    """Sample daily trend (seeded, so reruns reuse the cached frame)."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=30, freq="D"),
+        "value": rng.integers(100, 1000, 30)
+    })
 
 def main():
     """Analytics application."""
@@ -461,39 +344,44 @@ def main():
     
     with col1:
         st.subheader("Key Metrics")
-        metrics = {{
+        metrics = {
             "total_revenue": 150000,
             "avg_user_value": 75.50,
             "conversion_rate": 0.125
-        }}
+        }
         ui_components.display_metrics(metrics)
     
     with col2:
         st.subheader("Trends")
         # Sample trend data
-        dates = pd.date_range("2024-01-01", periods=30, freq="D")
-        values = np.random.randint(100, 1000, 30)
-        trend_df = pd.DataFrame({{"date": dates, "value": values}})
+        trend_df = _trend_df(0)
         ui_components.create_line_chart(trend_df, "date", "value", "Daily Trend")
 
 if __name__ == "__main__":
     main()
 '''
-    
-    def _get_dashboard_template(self, app_name: str) -> str:
-        """Get dashboard app template."""
-        return f'''import streamlit as st
-import pandas as pd
-import sys
-from pathlib import Path
 
-shared_path = Path(__file__).parent.parent / "shared"
-sys.path.insert(0, str(shared_path))
+DASHBOARD_APP_TMPL = '''import streamlit as st
+import pandas as pd
+import numpy as np
 
-from shared.common import snowflake_utils, ui_components, data_utils
+from common import snowflake_utils, ui_components, data_utils
 from config.config import PAGE_CONFIG, APP_TITLE
 
-st.set_page_config(**PAGE_CONFIG)
+if st.session_state.get("_page_config") != "main":
+    st.set_page_config(**PAGE_CONFIG)
+    st.session_state["_page_config"] = "main"
+
+@st.cache_data(show_spinner=False)
+def _sales_df(seed: int = 0) -> pd.DataFrame:
+    """Sample sales table (seeded, so reruns reuse the cached frame)."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "ID": range(1, 11),
+        "Product": [f"Product {i}" for i in range(1, 11)],
+        "Sales": rng.integers(100, 1000, 10),
+        "Region": rng.choice(["North", "South", "East", "West"], 10)
+    })
 
 def main():
     """Dashboard application."""
@@ -522,10 +410,10 @@ def main():
         col1, col2 = st.columns(2)
         with col1:
             # Sample bar chart
-            chart_data = pd.DataFrame({{
+            chart_data = pd.DataFrame({
                 "Category": ["A", "B", "C", "D"],
                 "Value": [100, 200, 150, 300]
-            }})
+            })
             ui_components.create_bar_chart(chart_data, "Category", "Value", "Sales by Category")
         
         with col2:
@@ -536,34 +424,26 @@ def main():
         st.header("Data Explorer")
         
         # Sample data table
-        sample_data = pd.DataFrame({{
-            "ID": range(1, 11),
-            "Product": [f"Product {{i}}" for i in range(1, 11)],
-            "Sales": np.random.randint(100, 1000, 10),
-            "Region": np.random.choice(["North", "South", "East", "West"], 10)
-        }})
+        sample_data = _sales_df(0)
         
         ui_components.create_data_table(sample_data, "Sample Sales Data")
 
 if __name__ == "__main__":
     main()
 '''
-    
-    def _get_ml_template(self, app_name: str) -> str:
-        """Get ML app template."""
-        return f'''import streamlit as st
+
+ML_APP_TMPL = '''import streamlit as st
 import pandas as pd
 import numpy as np
-import sys
-from pathlib import Path
 
-shared_path = Path(__file__).parent.parent / "shared"
-sys.path.insert(0, str(shared_path))
-
-from shared.common import snowflake_utils, ui_components, data_utils
+from common import snowflake_utils, ui_components, data_utils
 from config.config import PAGE_CONFIG, APP_TITLE
 
-st.set_page_config(**PAGE_CONFIG)
+if st.session_state.get("_page_config") != "main":
+    st.set_page_config(**PAGE_CONFIG)
+    st.session_state["_page_config"] = "main"
+
+rng = np.random.default_rng()
 
 def main():
     """ML application."""
@@ -586,17 +466,17 @@ def main():
         # Sample dataset
         n_samples = st.number_input("Number of samples", 100, 10000, 1000)
         if st.button("Generate Sample Data"):
-            data = {{
-                "feature_1": np.random.randn(n_samples),
-                "feature_2": np.random.randn(n_samples),
-                "target": np.random.randn(n_samples)
-            }}
+            data = {
+                "feature_1": rng.standard_normal(n_samples),
+                "feature_2": rng.standard_normal(n_samples),
+                "target": rng.standard_normal(n_samples)
+            }
             df = pd.DataFrame(data)
             ui_components.create_data_table(df.head(20), "Sample Data")
     
     with tab2:
         st.header("Model Training")
-        st.write(f"Training {{model_type}} with test size {{test_size}}")
+        st.write(f"Training {model_type} with test size {test_size}")
         
         if st.button("Train Model"):
             with st.spinner("Training model..."):
@@ -605,12 +485,12 @@ def main():
                 time.sleep(2)
                 
                 # Display training results
-                metrics = {{
+                metrics = {
                     "accuracy": 0.85,
                     "precision": 0.82,
                     "recall": 0.88,
                     "f1_score": 0.85
-                }}
+                }
                 ui_components.display_metrics(metrics)
     
     with tab3:
@@ -625,12 +505,137 @@ def main():
         with col2:
             if st.button("Predict"):
                 # Simulate prediction
-                prediction = np.random.randn()
-                st.metric("Prediction", f"{{prediction:.3f}}")
+                prediction = rng.standard_normal()
+                st.metric("Prediction", f"{prediction:.3f}")
 
 if __name__ == "__main__":
     main()
 '''
+
+
+class AppCreator:
+    """Creates new Streamlit application structures."""
+    
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.apps_dir = project_root / "apps"
+        self.templates_dir = project_root / "templates"
+        
+    def create_app_directory(self, app_name: str) -> Path:
+        """Create the app directory structure."""
+        app_dir = self.apps_dir / app_name
+        
+        # mkdir itself reports an existing app, no separate exists() check
+        try:
+            app_dir.mkdir(parents=True)
+        except FileExistsError:
+            raise ValueError(f"App directory already exists: {app_dir}") from None
+        logger.debug("Created directory: %s", app_dir)
+        
+        # The parent now exists, so each subdirectory is a single mkdir
+        for name in ("pages", "config", "tests"):
+            directory = app_dir / name
+            directory.mkdir()
+            logger.debug("Created directory: %s", directory)
+            
+        return app_dir
+    
+    def create_snowflake_config(self, app_dir: Path, app_name: str, 
+                               template: str = "basic") -> Tuple[Path, str]:
+        """Build the snowflake.yml configuration file."""
+        return app_dir / "snowflake.yml", SNOWFLAKE_YML_TMPL.format(name=app_name)
+    
+    def find_common_source(self) -> Path:
+        """Locate an existing app's common/ package to copy into new apps."""
+        sources = sorted(
+            item / "common" for item in self.apps_dir.iterdir()
+            if (item / "common" / "__init__.py").exists()
+        ) if self.apps_dir.is_dir() else []
+        if not sources:
+            raise ValueError(f"No existing app with a common/ package found in {self.apps_dir}")
+        return sources[0]
+    
+    def create_common_package(self, app_dir: Path, source: Optional[Path] = None) -> None:
+        """Copy the shared common/ utilities from an existing app."""
+        source = source or self.find_common_source()
+        
+        common_dir = app_dir / "common"
+        shutil.copytree(source, common_dir, ignore=shutil.ignore_patterns("__pycache__"))
+        
+        logger.info(f"Copied common utilities from {source} to {common_dir}")
+    
+    def create_environment_config(self, app_dir: Path, template: str = "basic") -> Tuple[Path, str]:
+        """Build the environment.yml file."""
+        dependencies = DEPENDENCIES_BY_TEMPLATE.get(template, BASE_DEPENDENCIES)
+        content = ENVIRONMENT_YML_TMPL.format(
+            name=app_dir.name,
+            dependencies="\n".join(f"- {dep}" for dep in dependencies)
+        )
+        return app_dir / "environment.yml", content
+    
+    def create_main_app(self, app_dir: Path, app_name: str, template: str = "basic") -> Tuple[Path, str]:
+        """Build the main streamlit_app.py file."""
+        
+        # Dispatch to the getter so only the selected template is built
+        templates = {
+            'basic': self._get_basic_template,
+            'analytics': self._get_analytics_template,
+            'dashboard': self._get_dashboard_template,
+            'ml': self._get_ml_template
+        }
+        get_template = templates.get(template, self._get_basic_template)
+        
+        return app_dir / "streamlit_app.py", get_template(app_name)
+    
+    def create_sample_page(self, app_dir: Path, app_name: str,
+                           app_title: Optional[str] = None) -> Tuple[Path, str]:
+        """Build a sample page."""
+        app_title = app_title or _app_title(app_name)
+        
+        content = SAMPLE_PAGE_TMPL.format(app_name=app_name, app_title=app_title)
+        return app_dir / "pages" / "details.py", content
+    
+    def create_config_file(self, app_dir: Path, app_name: str,
+                           app_title: Optional[str] = None) -> Tuple[Path, str]:
+        """Build the app configuration file."""
+        app_title = app_title or _app_title(app_name)
+        
+        content = CONFIG_TMPL.format(
+            app_name=app_name, app_title=app_title, app_words=app_name.replace('_', ' ')
+        )
+        return app_dir / "config" / "config.py", content
+    
+    def create_readme(self, app_dir: Path, app_name: str, template: str,
+                      app_title: Optional[str] = None) -> Tuple[Path, str]:
+        """Build the README file for the app."""
+        app_title = app_title or _app_title(app_name)
+        
+        content = README_TMPL.format(app_name=app_name, app_title=app_title, template=template)
+        return app_dir / "README.md", content
+    
+    def create_test_file(self, app_dir: Path, app_name: str) -> List[Tuple[Path, str]]:
+        """Build a basic test file and its shared pytest configuration."""
+        return [
+            (app_dir / "pytest.ini", PYTEST_INI),
+            (app_dir / "tests" / "conftest.py", CONFTEST_TMPL.format(app_name=app_name)),
+            (app_dir / "tests" / f"test_{app_name}.py", TEST_TMPL.format(app_name=app_name)),
+        ]
+    
+    def _get_basic_template(self, app_name: str) -> str:
+        """Get basic app template."""
+        return BASIC_APP_TMPL
+    
+    def _get_analytics_template(self, app_name: str) -> str:
+        """Get analytics app template."""
+        return ANALYTICS_APP_TMPL
+    
+    def _get_dashboard_template(self, app_name: str) -> str:
+        """Get dashboard app template."""
+        return DASHBOARD_APP_TMPL
+    
+    def _get_ml_template(self, app_name: str) -> str:
+        """Get ML app template."""
+        return ML_APP_TMPL
     
     def create_app(self, app_name: str, template: str = "basic", 
                   description: str = "") -> None:
@@ -639,26 +644,57 @@ if __name__ == "__main__":
         logger.info(f"Creating app: {app_name} with template: {template}")
         
         # Validate app name
-        if not app_name.replace('_', '').isalnum():
+        if not _APP_NAME_RE.match(app_name):
             raise ValueError("App name must contain only letters, numbers, and underscores")
         
+        # Find the shared utilities before anything is created on disk
+        common_source = self.find_common_source()
+        
         # Create directory structure
         app_dir = self.create_app_directory(app_name)
         
-        # Create all files
-        self.create_snowflake_config(app_dir, app_name, template)
-        self.create_environment_config(app_dir, template)
-        self.create_main_app(app_dir, app_name, template)
-        self.create_sample_page(app_dir, app_name)
-        self.create_config_file(app_dir, app_name)
-        self.create_readme(app_dir, app_name, template)
-        self.create_test_file(app_dir, app_name)
+        try:
+            files = self._populate_app(app_dir, app_name, template, common_source)
+        except Exception:
+            # A half-built app would make the next attempt fail with "already exists"
+            shutil.rmtree(app_dir, ignore_errors=True)
+            raise
+        
+        # One record for the whole scaffold instead of one per file
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Successfully created app %s in %s with %d files:\n%s",
+                app_name, app_dir, len(files),
+                "\n".join(f"  {path.relative_to(app_dir)}" for path, _ in files)
+            )
+    
+    def _populate_app(self, app_dir: Path, app_name: str, template: str,
+                      common_source: Path) -> List[Tuple[Path, str]]:
+        """Copy common/ into a new app directory and write its files."""
+        self.create_common_package(app_dir, common_source)
+        
+        # Render every file first, then write them together
+        app_title = _app_title(app_name)
+        files = [
+            self.create_snowflake_config(app_dir, app_name, template),
+            self.create_environment_config(app_dir, template),
+            self.create_main_app(app_dir, app_name, template),
+            self.create_sample_page(app_dir, app_name, app_title),
+            self.create_config_file(app_dir, app_name, app_title),
+            self.create_readme(app_dir, app_name, template, app_title),
+            *self.create_test_file(app_dir, app_name),
+        ]
+        # The writes are independent, so overlap their filesystem latency;
+        # every parent directory already exists at this point
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            list(executor.map(lambda item: item[0].write_text(item[1], encoding='utf-8'), files))
         
-        logger.info(f"Successfully created app: {app_name}")
-        logger.info(f"App directory: {app_dir}")
+        return files
 
 
 def main():
+    import argparse  # only needed when run as a script
+    
     parser = argparse.ArgumentParser(
         description="Create new Streamlit applications"
     )
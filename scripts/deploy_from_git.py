@@ -32,6 +32,26 @@ class GitStreamlitDeployer:
         self.apps_dir = project_root / "apps"
         self.connection = connection
         
+    def _stream_sql(self, sql_command: str) -> None:
+        """Run a `snow sql` command, logging its output line by line as it arrives."""
+        cmd = [
+            "snow", "sql", "-q", sql_command,
+            "--connection", self.connection
+        ]
+        
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                logger.info(line.rstrip())
+        
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        
     def get_available_apps(self) -> List[str]:
         """Get list of available Streamlit apps."""
         if not self.apps_dir.exists():
@@ -62,27 +82,15 @@ class GitStreamlitDeployer:
         
         try:
             # Execute the SQL command
-            cmd = [
-                "snow", "sql", "-q", sql_command,
-                "--connection", self.connection
-            ]
-            
             logger.info(f"Executing SQL command for {app_name}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            self._stream_sql(sql_command)
             
             logger.info(f"Successfully created Streamlit app: {app_name}")
-            logger.info(f"Output: {result.stdout}")
             
             return True
             
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to create Streamlit app {app_name}: {e}")
-            logger.error(f"Error output: {e.stderr}")
             return False
     
     def update_streamlit_from_git(self, app_name: str, branch: str = "main") -> bool:
@@ -94,17 +102,7 @@ class GitStreamlitDeployer:
         
         try:
             # Refresh the git repository
-            cmd = [
-                "snow", "sql", "-q", refresh_sql,
-                "--connection", self.connection
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            self._stream_sql(refresh_sql)
             
             logger.info("Git repository refreshed successfully")
             
@@ -113,7 +111,6 @@ class GitStreamlitDeployer:
             
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to refresh git repository: {e}")
-            logger.error(f"Error output: {e.stderr}")
             return False
     
     def list_git_streamlit_apps(self) -> List[Dict[str, Any]]:
@@ -152,17 +149,7 @@ class GitStreamlitDeployer:
         sql_command = f"DROP STREAMLIT IF EXISTS STREAMLIT.APPS.{app_name.upper()};"
         
         try:
-            cmd = [
-                "snow", "sql", "-q", sql_command,
-                "--connection", self.connection
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            self._stream_sql(sql_command)
             
             logger.info(f"Successfully deleted Streamlit app: {app_name}")
             return True
@@ -207,17 +194,7 @@ class GitStreamlitDeployer:
         sql_command = "ALTER GIT REPOSITORY streamlit_apps_repo FETCH;"
         
         try:
-            cmd = [
-                "snow", "sql", "-q", sql_command,
-                "--connection", self.connection
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            self._stream_sql(sql_command)
             
             logger.info("Successfully synced from git repository")
             return True
@@ -0,0 +1,44 @@
+"""
+Tests for the app creation script.
+"""
+
+import pytest
+
+import create_app
+from create_app import AppCreator, _APP_NAME_RE
+
+
+@pytest.mark.parametrize("name", ["sales", "sales_dashboard", "app_2", "_internal", "A1"])
+def test_app_name_accepts_valid_names(name):
+    assert _APP_NAME_RE.match(name)
+
+
+@pytest.mark.parametrize("name", ["", "_", "___", "bad-name", "has space", "app\n", "café"])
+def test_app_name_rejects_invalid_names(name):
+    assert not _APP_NAME_RE.match(name)
+
+
+def test_create_app_rejects_underscore_only_name(tmp_path):
+    with pytest.raises(ValueError, match="App name"):
+        AppCreator(project_root=tmp_path).create_app("___")
+    assert not (tmp_path / "apps").exists()
+
+
+def test_create_app_without_common_source_creates_nothing(tmp_path):
+    (tmp_path / "apps").mkdir()
+    with pytest.raises(ValueError, match="common/"):
+        AppCreator(project_root=tmp_path).create_app("new_app")
+    assert not (tmp_path / "apps" / "new_app").exists()
+
+
+def test_create_app_removes_partial_app_on_failure(tmp_path, monkeypatch):
+    (tmp_path / "apps" / "existing" / "common").mkdir(parents=True)
+    (tmp_path / "apps" / "existing" / "common" / "__init__.py").write_text("")
+    
+    def fail_copy(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(create_app.shutil, "copytree", fail_copy)
+    
+    with pytest.raises(OSError):
+        AppCreator(project_root=tmp_path).create_app("new_app")
+    assert not (tmp_path / "apps" / "new_app").exists()
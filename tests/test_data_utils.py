@@ -0,0 +1,57 @@
+"""
+Tests for the shared data utilities.
+"""
+
+import pandas as pd
+
+from common.data_utils import filter_data_by_date_range
+
+
+def _orders(tz=None):
+    df = pd.DataFrame(
+        {
+            "date": ["2024-01-05", "2024-01-01", None, "2024-01-03", "2024-02-01"],
+            "value": [1, 2, 3, 4, 5],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+    if tz is not None:
+        df["date"] = pd.to_datetime(df["date"]).dt.tz_localize(tz)
+    return df
+
+
+def test_filter_keeps_original_order_and_index():
+    result = filter_data_by_date_range(_orders(), "date", "2024-01-01", "2024-01-05")
+    assert list(result.index) == [10, 11, 13]
+    assert list(result["value"]) == [1, 2, 4]
+    assert pd.api.types.is_datetime64_any_dtype(result["date"])
+
+
+def test_filter_tz_aware_with_naive_bounds():
+    result = filter_data_by_date_range(_orders("US/Eastern"), "date", "2024-01-02", "2024-01-05")
+    assert list(result.index) == [10, 13]
+    assert str(result["date"].dt.tz) == "US/Eastern"
+
+
+def test_filter_tz_aware_with_aware_bounds():
+    start = pd.Timestamp("2024-01-03 05:00", tz="UTC")  # midnight US/Eastern
+    result = filter_data_by_date_range(_orders("US/Eastern"), "date", start, "2024-01-04")
+    assert list(result.index) == [13]
+
+
+def test_filter_sees_edits_outside_the_hash_sample():
+    # Streamlit hashes frames of 50k+ rows from a sample, so an edit to one
+    # row must not be served from a result computed before the edit
+    df = pd.DataFrame({
+        "date": pd.date_range("2020-01-01", periods=60_000, freq="h"),
+        "value": range(60_000),
+    })
+    assert len(filter_data_by_date_range(df, "date", "2030-01-01", "2030-12-31")) == 0
+    
+    df.loc[30, "date"] = pd.Timestamp("2030-06-01")
+    
+    moved = filter_data_by_date_range(df, "date", "2030-01-01", "2030-12-31")
+    assert list(moved.index) == [30]
+    assert moved.loc[30, "date"] == pd.Timestamp("2030-06-01")
+    early = filter_data_by_date_range(df, "date", "2020-01-02", "2020-01-02 12:00")
+    assert 30 not in early.index
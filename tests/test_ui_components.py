@@ -0,0 +1,53 @@
+"""
+Tests for the shared UI components.
+"""
+
+import pandas as pd
+import plotly.express as px
+
+from common.ui_components import _csv_bytes, _line_figure, _scatter_figure
+
+
+def test_scatter_bubble_scale_matches_plotly_express():
+    df = pd.DataFrame({
+        "x": [1, 2, 3, 4],
+        "y": [4, 3, 2, 1],
+        "size": [10, 20, 30, 40],
+        "group": ["a", "a", "b", "b"],
+    })
+    expected = px.scatter(df, x="x", y="y", color="group", size="size")
+    fig = _scatter_figure(df, "x", "y", None, "group", "size")
+    
+    assert len(fig.data) == len(expected.data)
+    for trace, ref in zip(fig.data, expected.data):
+        assert trace.marker.sizemode == ref.marker.sizemode
+        assert trace.marker.sizeref == ref.marker.sizeref
+        assert list(trace.marker.size) == list(ref.marker.size)
+
+
+def test_csv_bytes_reflect_edits_outside_the_hash_sample():
+    df = pd.DataFrame({"value": range(60_000)})
+    before = _csv_bytes(df)
+    df.loc[30, "value"] = -1
+    assert _csv_bytes(df) != before
+    assert b"\n-1\n" in _csv_bytes(df)
+
+
+def test_cached_figure_is_not_shared_between_callers():
+    df = pd.DataFrame({"x": [1, 2, 3], "y": [3, 1, 2]})
+    first = _line_figure(df, "x", "y", "Original", None)
+    first.update_layout(title_text="Changed by a caller")
+    first.add_scatter(x=[0], y=[0])
+    
+    second = _line_figure(df, "x", "y", "Original", None)
+    assert second.layout.title.text == "Original"
+    assert len(second.data) == 1
+
+
+def test_cached_figure_sees_edits_outside_the_hash_sample():
+    df = pd.DataFrame({"x": range(60_000), "y": [0.0] * 60_000})
+    before = _line_figure(df, "x", "y", None, None)
+    df.loc[30, "y"] = 99.0
+    after = _line_figure(df, "x", "y", None, None)
+    assert before.data[0].y[30] == 0.0
+    assert after.data[0].y[30] == 99.0